@@ -21,6 +21,7 @@ from google.genai import types
 
 from ..observability.logger import get_structured_logger
 from ..core.orchestrator import SimulationOrchestrator
+from ..tools.http_session import close_sessions_on_shutdown
 
 logger = get_structured_logger(__name__)
 
@@ -303,6 +304,7 @@ work with appropriate agents."""
             title=f"{self.agent_name} A2A Server",
             description=f"A2A Protocol server for ADK-powered {self.agent_name}",
             version="1.0.0",
+            lifespan=close_sessions_on_shutdown,
         )
 
         # Add CORS middleware
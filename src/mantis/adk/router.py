@@ -377,21 +377,23 @@ coordinate with appropriate agents.""",
                     agents_list = await func(count)
 
                     # Convert agent dictionaries to a formatted string for pydantic-ai compatibility
-                    result_lines = [f"🎯 **Selected {len(agents_list)} Agents for Team Assembly**\n"]
-
-                    for i, agent in enumerate(agents_list, 1):
-                        result_lines.append(f"**{i}. {agent['name']}** (ID: {agent['agent_id']})")
-                        result_lines.append(f"   Description: {agent['description']}")
-                        result_lines.append(f"   Role Preference: {agent['role_preference']}")
-                        result_lines.append(f"   Available: {'Yes' if agent['available'] else 'No'}")
-                        result_lines.append("")
-
-                    result_lines.append(
-                        f"✅ **Team Assembly Complete**: {len(agents_list)} agents ready for coordination"
+                    # One f-string block per agent (trailing newline leaves a blank separator line)
+                    agent_blocks = [
+                        f"**{i}. {agent['name']}** (ID: {agent['agent_id']})\n"
+                        f"   Description: {agent['description']}\n"
+                        f"   Role Preference: {agent['role_preference']}\n"
+                        f"   Available: {'Yes' if agent['available'] else 'No'}\n"
+                        for i, agent in enumerate(agents_list, 1)
+                    ]
+
+                    return "\n".join(
+                        [
+                            f"🎯 **Selected {len(agents_list)} Agents for Team Assembly**\n",
+                            *agent_blocks,
+                            f"✅ **Team Assembly Complete**: {len(agents_list)} agents ready for coordination",
+                        ]
                     )
 
-                    return "\n".join(result_lines)
-
                 except Exception as e:
                     # FAIL HARD - team formation errors should be observable and re-raised
                     logger.error(
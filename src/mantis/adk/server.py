@@ -13,6 +13,7 @@ from .router import AgentRouter
 from ..proto.mantis.v1 import mantis_core_pb2
 from ..observability.logger import get_structured_logger
 from ..config import DEFAULT_MODEL
+from ..tools.http_session import close_sessions_on_shutdown
 
 logger = get_structured_logger(__name__)
 
@@ -28,7 +29,12 @@ def create_adk_router_app(router: AgentRouter, name: str = "ADK Agent Router") -
     Returns:
         FastAPI application with A2A-compatible endpoints
     """
-    app = FastAPI(title=name, description="ADK-powered orchestration router with A2A boundaries", version="1.0.0")
+    app = FastAPI(
+        title=name,
+        description="ADK-powered orchestration router with A2A boundaries",
+        version="1.0.0",
+        lifespan=close_sessions_on_shutdown,
+    )
 
     @app.get("/health")
     async def health_check() -> Dict[str, Any]:
@@ -724,15 +724,12 @@ class FieldNamingConvention(Enum):
     SNAKE_CASE = "snake_case"
 
 
-def json_to_protobuf_agent_card(
-    agent_data: Dict[str, Any], input_convention: FieldNamingConvention = FieldNamingConvention.CAMEL_CASE
-) -> "AgentCard":
+def json_to_protobuf_agent_card(agent_data: Dict[str, Any]) -> "AgentCard":
     """
-    Convert JSON agent data to protobuf AgentCard with flexible field name handling.
+    Convert JSON agent data to protobuf AgentCard, accepting camelCase or snake_case field names.
 
     Args:
         agent_data: Dict with agent card data (can be MantisAgentCard or basic AgentCard JSON)
-        input_convention: Naming convention of input JSON fields
 
     Returns:
         Protobuf AgentCard object
@@ -744,33 +741,12 @@ def json_to_protobuf_agent_card(
     if "agent_card" in agent_data:
         agent_data = agent_data["agent_card"]
 
-    def convert_keys(obj: Any) -> Any:
-        if isinstance(obj, dict):
-            new_obj = {}
-            for key, value in obj.items():
-                # Handle field name conversion based on input convention
-                if input_convention == FieldNamingConvention.CAMEL_CASE:
-                    # Convert known camelCase fields to snake_case
-                    if key == "stateTransitionHistory":
-                        # Skip - not in current protobuf spec
-                        continue
-                    elif key == "pushNotifications":
-                        new_key = "push_notifications"
-                    else:
-                        new_key = key
-                else:
-                    # Already snake_case, use as-is
-                    new_key = key
-
-                new_obj[new_key] = convert_keys(value)
-            return new_obj
-        elif isinstance(obj, list):
-            return [convert_keys(item) for item in obj]
-        else:
-            return obj
-
-    converted_data = convert_keys(agent_data)
-    return ParseDict(converted_data, AgentCard(), ignore_unknown_fields=True)  # type: ignore[no-any-return]
+    # ParseDict already accepts both camelCase JSON names (e.g. pushNotifications) and snake_case
+    # field names, and ignore_unknown_fields drops fields outside the current spec such as
+    # stateTransitionHistory, so either convention is parsed directly without first rebuilding a
+    # renamed copy of the whole (extension-heavy) card dict. Keys inside Struct values such as
+    # extension params are free-form and are kept exactly as given.
+    return ParseDict(agent_data, AgentCard(), ignore_unknown_fields=True)  # type: ignore[no-any-return]
 
 
 def protobuf_to_json_agent_card(
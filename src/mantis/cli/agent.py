@@ -10,7 +10,7 @@ from typing import Optional, Any
 import rich_click as click
 from rich.console import Console
 
-from .core import cli, use_global_options
+from .core import cli, run_async, use_global_options
 from ..observability.logger import get_structured_logger
 
 console = Console()
@@ -1145,7 +1145,7 @@ def serve_all(
             await asyncio.gather(*server_tasks)
 
         # Run all servers
-        asyncio.run(run_all_servers())
+        run_async(run_all_servers())
         return 0
 
     except FileNotFoundError:
@@ -8,8 +8,9 @@ This module provides the foundation for the modern Mantis CLI including:
 - Rich formatting and consistent UX patterns
 """
 
+import asyncio
 import functools
-from typing import List, Optional, Callable, Any
+from typing import Coroutine, List, Optional, Callable, Any, TypeVar
 from pathlib import Path
 
 import rich_click as click
@@ -17,6 +18,17 @@ from rich.console import Console
 from rich.panel import Panel
 
 from ..observability.logger import get_structured_logger
+from ..tools.http_session import close_all_sessions
+
+# Optional libuv-based event loop (installed with the "speedups" extra)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
 
 # Configure rich-click for better UX
 click.rich_click.USE_RICH_MARKUP = True
@@ -229,3 +241,20 @@ def info_message(message: str) -> None:
 def error_message(message: str) -> None:
     """Display an error message with consistent formatting."""
     console.print(f"[red]❌ {message}[/red]")
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    Shared tool HTTP sessions are closed before the loop shuts down.
+    """
+
+    async def _run_and_close_sessions() -> T:
+        try:
+            return await main
+        finally:
+            await close_all_sessions()
+
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(_run_and_close_sessions())
+    return asyncio.run(_run_and_close_sessions())
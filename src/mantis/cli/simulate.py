@@ -9,7 +9,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 
-from .core import cli, use_global_options, error_handler
+from .core import cli, run_async, use_global_options, error_handler
 from ..core import SimulationOrchestrator, SimulationInputBuilder
 from ..proto.mantis.v1 import mantis_core_pb2
 from ..observability.logger import get_structured_logger
@@ -102,10 +102,8 @@ def simulate(
         orchestrator = SimulationOrchestrator()
 
         # Run the simulation (handle async)
-        import asyncio
-
         try:
-            simulation_output = asyncio.run(orchestrator.execute_simulation(simulation_input))
+            simulation_output = run_async(orchestrator.execute_simulation(simulation_input))
 
             # Display results
             _display_simulation_output(simulation_output, verbose)
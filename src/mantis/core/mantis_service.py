@@ -10,6 +10,7 @@ and native A2A protocol support through SimulationOutput wrapper.
 """
 
 from typing import List, Dict, Any
+import asyncio
 import uuid
 
 from .orchestrator import SimulationOrchestrator
@@ -23,6 +24,9 @@ from ..observability.logger import get_structured_logger
 
 logger = get_structured_logger(__name__)
 
+# Upper bound on team members simulated at once
+_MAX_CONCURRENT_TEAM_MEMBERS = 16
+
 
 # Using proper protobuf types from mantis_core_pb2 as per PRD requirements
 
@@ -247,42 +251,58 @@ class MantisService:
                 simulation_input=simulation_input, team_size=team_request.team_size
             )
 
-            # Execute each team member with AgentInterface
-            team_responses = []
-            for i, agent_interface in enumerate(team_members):
-                try:
-                    # Process individual simulation for team member
-                    member_output = await self.process_simulation_input(
-                        simulation_input=simulation_input, agent_interface=agent_interface
-                    )
-
-                    team_responses.append(member_output)
-
-                    logger.debug(
-                        "Completed team member execution",
-                        structured_data={
-                            "context_id": getattr(team_request, "context_id", "unknown"),  # type: ignore[attr-defined]
-                            "member_index": i,
-                            "agent_name": agent_interface.name,
-                            "final_state": member_output.final_state,
-                        },
-                    )
-
-                except Exception as member_error:
-                    logger.error(
-                        "Team member execution failed - failing entire team execution fast",
-                        structured_data={
-                            "context_id": team_request.simulation_input.context_id,
-                            "member_index": i,
-                            "agent_name": agent_interface.name,
-                            "error_type": type(member_error).__name__,
-                            "error_message": str(member_error),
-                        },
-                    )
-                    # Fail fast - team execution requires all members to succeed
-                    raise RuntimeError(
-                        f"Team member execution failed for {agent_interface.name}: {str(member_error)}"
-                    ) from member_error
+            # Execute team members concurrently, bounded so large teams don't stampede the orchestrator
+            semaphore = asyncio.Semaphore(min(len(team_members), _MAX_CONCURRENT_TEAM_MEMBERS) or 1)
+
+            async def _execute_member(i: int, agent_interface: AgentInterface) -> mantis_core_pb2.SimulationOutput:
+                async with semaphore:
+                    try:
+                        # Process individual simulation for team member
+                        member_output = await self.process_simulation_input(
+                            simulation_input=simulation_input, agent_interface=agent_interface
+                        )
+                    except Exception as member_error:
+                        logger.error(
+                            "Team member execution failed - failing entire team execution fast",
+                            structured_data={
+                                "context_id": team_request.simulation_input.context_id,
+                                "member_index": i,
+                                "agent_name": agent_interface.name,
+                                "error_type": type(member_error).__name__,
+                                "error_message": str(member_error),
+                            },
+                        )
+                        # Fail fast - team execution requires all members to succeed
+                        raise RuntimeError(
+                            f"Team member execution failed for {agent_interface.name}: {str(member_error)}"
+                        ) from member_error
+
+                logger.debug(
+                    "Completed team member execution",
+                    structured_data={
+                        "context_id": getattr(team_request, "context_id", "unknown"),  # type: ignore[attr-defined]
+                        "member_index": i,
+                        "agent_name": agent_interface.name,
+                        "final_state": member_output.final_state,
+                    },
+                )
+                return member_output
+
+            # The task group cancels the remaining members on the first failure
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    member_tasks = [
+                        task_group.create_task(_execute_member(i, agent_interface))
+                        for i, agent_interface in enumerate(team_members)
+                    ]
+            except BaseExceptionGroup as group:
+                # Surface the first member failure itself rather than the exception group,
+                # keeping the member error recorded as its cause
+                first_failure = group.exceptions[0]
+                raise first_failure from first_failure.__cause__
+
+            # Responses stay in team member order
+            team_responses = [task.result() for task in member_tasks]
 
             # Create TeamExecutionResult
             team_result = mantis_core_pb2.TeamExecutionResult()
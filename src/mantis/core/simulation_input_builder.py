@@ -3,8 +3,8 @@ SimulationInput builder for converting CLI arguments to protobuf messages.
 """
 
 from typing import List, Optional, Union
+import time
 import uuid
-import asyncio
 
 from ..proto.mantis.v1 import mantis_core_pb2
 from ..config import DEFAULT_MAX_DEPTH
@@ -185,14 +185,7 @@ class SimulationInputBuilder:
         simulation_input.query = self._query  # type: ignore  # Validated above
 
         # Generate unique context ID
-        try:
-            loop_time = asyncio.get_event_loop().time()
-        except RuntimeError:
-            import time
-
-            loop_time = time.time()
-
-        simulation_input.context_id = f"cli_{int(loop_time)}_{uuid.uuid4().hex[:8]}"
+        simulation_input.context_id = f"cli_{int(time.monotonic())}_{uuid.uuid4().hex[:8]}"
 
         if self._context:
             simulation_input.context = self._context
@@ -4,7 +4,6 @@ Random team formation strategy using agent registry.
 
 import random
 from typing import List
-import aiohttp
 
 from .base import BaseTeam
 from ...proto.mantis.v1 import mantis_core_pb2
@@ -12,7 +11,7 @@ from ...proto.mantis.v1.mantis_persona_pb2 import MantisAgentCard
 from ...agent import AgentInterface
 from ...observability.logger import get_structured_logger
 from ...config import get_default_base_agent, DEFAULT_REGISTRY
-from ...agent.card import load_agent_card_from_json
+from ...tools.agent_registry import list_all_agents
 
 
 class RandomTeam(BaseTeam):
@@ -92,39 +91,14 @@ class RandomTeam(BaseTeam):
         """Get all available agents from the agent registry using list_agents method."""
         logger = get_structured_logger(__name__)
 
-        jsonrpc_url = f"{DEFAULT_REGISTRY}/jsonrpc"
-        list_payload = {"jsonrpc": "2.0", "method": "list_agents", "params": {}, "id": 1}
-
         logger.debug("Calling list_agents on registry", structured_data={"registry_url": DEFAULT_REGISTRY})
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(jsonrpc_url, json=list_payload) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"Registry request failed with status {response.status}")
-
-                data = await response.json()
-
-                if "error" in data:
-                    raise RuntimeError(f"Registry error: {data['error']['message']}")
-
-                all_agents_json = data.get("result", {}).get("agents", [])
-
-                # Convert JSON agent data to MantisAgentCard protobuf objects
-                mantis_agents = []
-                for agent_json in all_agents_json:
-                    try:
-                        mantis_card = load_agent_card_from_json(agent_json)
-                        mantis_agents.append(mantis_card)
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to convert agent from registry",
-                            structured_data={"agent_name": agent_json.get("name", "unknown"), "error": str(e)},
-                        )
-                        continue
-
-                logger.info(
-                    "Successfully loaded agents from registry",
-                    structured_data={"total_agents": len(mantis_agents), "registry_url": DEFAULT_REGISTRY},
-                )
-
-                return mantis_agents
+        # Reuse the registry tool's pooled session and card parsing instead of a one-off session per call
+        mantis_agents = await list_all_agents()
+
+        logger.info(
+            "Successfully loaded agents from registry",
+            structured_data={"total_agents": len(mantis_agents), "registry_url": DEFAULT_REGISTRY},
+        )
+
+        return mantis_agents
@@ -101,6 +101,10 @@ class ObservabilityLogger:
         # Prevent propagation to avoid duplicate logs
         self.logger.propagate = False
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at this level would be emitted, to skip building costly payloads."""
+        return self.logger.isEnabledFor(level)
+
     def _log_with_data(
         self,
         level: int,
@@ -7,12 +7,14 @@ for recursive agent invocation through the simulation architecture.
 
 import asyncio
 import logging
+import time
 import grpc  # type: ignore[import-untyped]
 from grpc import aio  # type: ignore[import-untyped]
 from typing import cast
 
 from ..proto.mantis.v1 import mantis_core_pb2, mantis_core_pb2_grpc
 from ..core.orchestrator import SimulationOrchestrator
+from ..tools.http_session import close_all_sessions
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +63,7 @@ class MantisServiceServicer(mantis_core_pb2_grpc.MantisServiceServicer):
 
             # Set defaults if not specified
             if not request.context_id:
-                request.context_id = f"sim_{int(asyncio.get_event_loop().time())}"
+                request.context_id = f"sim_{int(time.monotonic())}"
 
             if not request.execution_strategy:
                 request.execution_strategy = mantis_core_pb2.EXECUTION_STRATEGY_DIRECT
@@ -104,7 +106,7 @@ class MantisServiceServicer(mantis_core_pb2_grpc.MantisServiceServicer):
             # Convert UserRequest to SimulationInput
             simulation_input = mantis_core_pb2.SimulationInput()
             simulation_input.query = request.query
-            simulation_input.context_id = f"user_{int(asyncio.get_event_loop().time())}"
+            simulation_input.context_id = f"user_{int(time.monotonic())}"
 
             if request.context:
                 simulation_input.context = request.context
@@ -181,7 +183,7 @@ class MantisServiceServicer(mantis_core_pb2_grpc.MantisServiceServicer):
             # Convert UserRequest to SimulationInput for narrator context
             simulation_input = mantis_core_pb2.SimulationInput()
             simulation_input.query = request.user_request.query
-            simulation_input.context_id = f"narrator_{int(asyncio.get_event_loop().time())}"
+            simulation_input.context_id = f"narrator_{int(time.monotonic())}"
 
             # Synthesize narrative from team results
             response = await narrator.synthesize_narrative(simulation_input, request.team_result)
@@ -221,6 +223,8 @@ async def serve_grpc(port: int = 50051, host: str = "localhost") -> None:
     except KeyboardInterrupt:
         logger.info("Shutting down gRPC server...")
         await server.stop(grace=5.0)
+    finally:
+        await close_all_sessions()
 
 
 if __name__ == "__main__":
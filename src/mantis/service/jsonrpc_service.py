@@ -8,6 +8,7 @@ Single clean orchestrator with dependency injection.
 import asyncio
 import json
 import logging
+import time
 from typing import Dict, Any, cast
 from aiohttp import web, web_request
 from google.protobuf.json_format import MessageToDict
@@ -131,7 +132,7 @@ class MantisJSONRPCService:
         simulation_input.query = params["query"]
 
         # Optional fields with defaults
-        simulation_input.context_id = params.get("context_id", f"sim_{int(asyncio.get_event_loop().time())}")
+        simulation_input.context_id = params.get("context_id", f"sim_{int(time.monotonic())}")
         simulation_input.parent_context_id = params.get("parent_context_id", "")
         simulation_input.context = params.get("context", "")
         simulation_input.min_depth = params.get("min_depth", 0)
@@ -5,7 +5,7 @@ Simplified to only export the direct pydantic-ai functions.
 
 # Import native pydantic-ai tool functions
 from .agent_registry import registry_search_agents, registry_get_agent_details
-from .web_fetch import web_fetch_url
+from .web_fetch import web_fetch_url, web_fetch_urls
 from .web_search import web_search
 from .git_operations import git_analyze_repository
 from .gitlab_integration import gitlab_list_projects, gitlab_list_issues, gitlab_create_issue, gitlab_get_issue
@@ -16,6 +16,7 @@ __all__ = [
     "registry_search_agents",
     "registry_get_agent_details",
     "web_fetch_url",
+    "web_fetch_urls",
     "web_search",
     "git_analyze_repository",
     "gitlab_list_projects",
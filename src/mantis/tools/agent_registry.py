@@ -4,8 +4,10 @@ Simplified to only support pydantic-ai integration.
 """
 
 import logging
+import time
 import aiohttp
-from typing import List
+import orjson
+from typing import Any, Dict, List, Optional, Tuple
 
 # Observability imports
 try:
@@ -15,7 +17,17 @@ try:
 except ImportError:
     OBSERVABILITY_AVAILABLE = False
 
+# Optional non-blocking DNS resolver for registry connections
+try:
+    import aiodns  # noqa: F401
+
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
 from ..config import DEFAULT_REGISTRY
+from .cache import TTLCache
+from .http_session import SharedSession
 from ..proto.mantis.v1.mantis_persona_pb2 import MantisAgentCard
 from ..agent.card import load_agent_card_from_json
 
@@ -27,6 +39,42 @@ if OBSERVABILITY_AVAILABLE:
 else:
     obs_logger = None  # type: ignore
 
+# Shared registry session: every registry call reuses one connection pool instead of a fresh TCP handshake
+_REGISTRY_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Registry endpoints, built once since DEFAULT_REGISTRY is fixed at import
+_JSONRPC_URL = f"{DEFAULT_REGISTRY}/jsonrpc"
+_SEARCH_URL = f"{DEFAULT_REGISTRY}/search"
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """Build the registry session.
+
+    DNS for the registry host is cached and resolved asynchronously when aiodns is installed,
+    so new pooled connections don't block the event loop in getaddrinfo.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=128,
+        limit_per_host=32,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        keepalive_timeout=90,
+        enable_cleanup_closed=True,
+        resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=_REGISTRY_TIMEOUT)
+
+
+_SESSION = SharedSession(_new_session)
+
+
+# Name/ID lookup index over the registry: (expires_at, by_name_or_id, names in registry order)
+_AGENT_INDEX_TTL = 10.0
+_AGENT_INDEX: Optional[Tuple[float, Dict[str, MantisAgentCard], List[str]]] = None
+
+# Registry search results keyed by (normalized query, limit) -> agents
+_SEARCH_CACHE: TTLCache[Tuple[str, int], List[Dict[str, Any]]] = TTLCache(ttl=60.0, max_entries=256)
+
 
 async def registry_search_agents(query: str, limit: int = 20) -> str:
     """Search for agents in the registry using natural language queries.
@@ -42,39 +90,43 @@ async def registry_search_agents(query: str, limit: int = 20) -> str:
         obs_logger.info(f"🎯 TOOL_INVOKED: registry_search_agents with query: '{query}', limit: {limit}")
 
     try:
-        from ..config import DEFAULT_REGISTRY
-
-        # Simple HTTP search request
-        search_url = f"{DEFAULT_REGISTRY}/search"
-        timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(search_url, json={"query": query, "limit": limit}) as response:
+        # Simple HTTP search request; repeated queries (ignoring case and spacing) are served from cache
+        cache_key = (" ".join(query.lower().split()), limit)
+        agents = _SEARCH_CACHE.get(cache_key)
+        if agents is None:
+            session = await _SESSION.get()
+            async with session.post(
+                _SEARCH_URL, data=orjson.dumps({"query": query, "limit": limit}), headers=_JSON_HEADERS
+            ) as response:
                 if response.status != 200:
                     return f"Registry search failed: HTTP {response.status}"
 
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 agents = data.get("agents", [])
+            # An empty result may just mean the agent hasn't registered yet, so only hits are cached
+            if agents:
+                _SEARCH_CACHE.set(cache_key, agents)
 
-                if not agents:
-                    return f"No agents found matching query: '{query}'"
+        if not agents:
+            return f"No agents found matching query: '{query}'"
 
-                # Format results for LLM
-                formatted_results = []
-                for agent in agents:
-                    name = agent.get("name", "Unknown")
-                    description = agent.get("description", "No description")
-                    url = agent.get("url", "No URL")
-                    similarity = agent.get("similarity_score", 0)
+        # Format results for LLM
+        formatted_results = []
+        for agent in agents:
+            name = agent.get("name", "Unknown")
+            description = agent.get("description", "No description")
+            url = agent.get("url", "No URL")
+            similarity = agent.get("similarity_score", 0)
 
-                    sim_info = f" (similarity: {similarity:.3f})" if similarity else ""
-                    formatted_results.append(f"- **{name}**{sim_info}: {description}\\n  URL: {url}")
+            sim_info = f" (similarity: {similarity:.3f})" if similarity else ""
+            formatted_results.append(f"- **{name}**{sim_info}: {description}\\n  URL: {url}")
 
-                result_text = f"Found {len(agents)} agents matching '{query}':\\n\\n" + "\\n\\n".join(formatted_results)
+        result_text = f"Found {len(agents)} agents matching '{query}':\\n\\n" + "\\n\\n".join(formatted_results)
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"Registry search returned {len(agents)} results")
+        if OBSERVABILITY_AVAILABLE and obs_logger:
+            obs_logger.info(f"Registry search returned {len(agents)} results")
 
-                return result_text
+        return result_text
 
     except Exception as e:
         error_msg = f"Error searching agents: {str(e)}"
@@ -99,25 +151,24 @@ async def registry_get_agent_details(agent_url: str) -> str:
         # from ..agent.card import format_mantis_card_for_llm  # TODO: Implement this function
 
         # Simple HTTP request to get agent details
-        timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(agent_url) as response:
-                if response.status != 200:
-                    return f"Failed to fetch agent details: HTTP {response.status}"
+        session = await _SESSION.get()
+        async with session.get(agent_url) as response:
+            if response.status != 200:
+                return f"Failed to fetch agent details: HTTP {response.status}"
 
-                # Parse the MantisAgentCard from response
-                data = await response.json()
+            # Parse the MantisAgentCard from response
+            data = orjson.loads(await response.read())
 
-                # Use existing card formatting functionality
-                from ..proto.mantis.v1.mantis_persona_pb2 import MantisAgentCard
+            # Use existing card formatting functionality
+            from ..proto.mantis.v1.mantis_persona_pb2 import MantisAgentCard
 
-                mantis_card = MantisAgentCard()
-                # Simple conversion from JSON to protobuf (simplified)
-                mantis_card.agent_card.name = data.get("name", "Unknown")
-                mantis_card.agent_card.description = data.get("description", "No description")
+            mantis_card = MantisAgentCard()
+            # Simple conversion from JSON to protobuf (simplified)
+            mantis_card.agent_card.name = data.get("name", "Unknown")
+            mantis_card.agent_card.description = data.get("description", "No description")
 
-                # return format_mantis_card_for_llm(mantis_card)  # TODO: Implement this function
-                return f"Agent Details: {mantis_card.agent_card.name} - {mantis_card.agent_card.description}"
+            # return format_mantis_card_for_llm(mantis_card)  # TODO: Implement this function
+            return f"Agent Details: {mantis_card.agent_card.name} - {mantis_card.agent_card.description}"
 
     except Exception as e:
         error_msg = f"Error getting agent details for {agent_url}: {str(e)}"
@@ -145,39 +196,36 @@ async def list_all_agents(page_size: int = 200, include_inactive: bool = False)
         jsonrpc_request = {"jsonrpc": "2.0", "method": "list_agents", "params": {}, "id": 1}
 
         # Use same SSL fix as registration to avoid aiohttp issues
-        timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                f"{DEFAULT_REGISTRY}/jsonrpc", json=jsonrpc_request, headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status != 200:
-                    raise Exception(f"HTTP {response.status}: {await response.text()}")
+        session = await _SESSION.get()
+        async with session.post(_JSONRPC_URL, data=orjson.dumps(jsonrpc_request), headers=_JSON_HEADERS) as response:
+            if response.status != 200:
+                raise Exception(f"HTTP {response.status}: {await response.text()}")
 
-                data = await response.json()
+            data = orjson.loads(await response.read())
 
-                if "error" in data:
-                    raise Exception(f"JSONRPC Error: {data['error']}")
+            if "error" in data:
+                raise Exception(f"JSONRPC Error: {data['error']}")
 
-                result = data.get("result", {})
-                registry_agent_cards = result.get("agents", [])
+            result = data.get("result", {})
+            registry_agent_cards = result.get("agents", [])
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"Retrieved {len(registry_agent_cards)} agents from registry")
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"Retrieved {len(registry_agent_cards)} agents from registry")
 
-                # Convert registry agent cards to MantisAgentCard objects
-                mantis_cards = []
-                for registry_card in registry_agent_cards:
-                    try:
-                        # The registry returns FastA2A format directly, not wrapped in agent_card
-                        # Convert to MantisAgentCard using the existing loader
-                        mantis_card = load_agent_card_from_json(registry_card)
-                        mantis_cards.append(mantis_card)
+            # Convert registry agent cards to MantisAgentCard objects
+            mantis_cards = []
+            for registry_card in registry_agent_cards:
+                try:
+                    # The registry returns FastA2A format directly, not wrapped in agent_card
+                    # Convert to MantisAgentCard using the existing loader
+                    mantis_card = load_agent_card_from_json(registry_card)
+                    mantis_cards.append(mantis_card)
 
-                    except Exception as e:
-                        logger.warning(f"Failed to parse agent card: {e}")
-                        continue
+                except Exception as e:
+                    logger.warning(f"Failed to parse agent card: {e}")
+                    continue
 
-                return mantis_cards
+            return mantis_cards
 
     except Exception as e:
         error_msg = f"Error listing agents from registry: {str(e)}"
@@ -186,6 +234,34 @@ async def list_all_agents(page_size: int = 200, include_inactive: bool = False)
         raise Exception(error_msg)
 
 
+async def _get_agent_index(refresh: bool = False) -> Tuple[Dict[str, MantisAgentCard], List[str], bool]:
+    """Return a name/ID -> card index over the registry, the agent names in registry order,
+    and whether the index was served from cache.
+
+    The index is cached for ``_AGENT_INDEX_TTL`` seconds and rebuilt whenever the agent list is refetched.
+    """
+    global _AGENT_INDEX
+    from ..agent import AgentInterface
+
+    now = time.monotonic()
+    if not refresh and _AGENT_INDEX is not None and _AGENT_INDEX[0] > now:
+        return _AGENT_INDEX[1], _AGENT_INDEX[2], True
+
+    all_agents = await list_all_agents()
+
+    by_key: Dict[str, MantisAgentCard] = {}
+    names: List[str] = []
+    for agent_card in all_agents:
+        agent_interface = AgentInterface(agent_card)
+        # setdefault keeps the first match, as the previous linear scan did
+        by_key.setdefault(agent_interface.name, agent_card)
+        by_key.setdefault(agent_interface.agent_id, agent_card)
+        names.append(agent_interface.name)
+
+    _AGENT_INDEX = (now + _AGENT_INDEX_TTL, by_key, names)
+    return by_key, names, False
+
+
 async def get_agent_by_name(agent_name: str) -> MantisAgentCard:
     """Get a specific agent by name from the registry.
 
@@ -203,26 +279,24 @@ async def get_agent_by_name(agent_name: str) -> MantisAgentCard:
         obs_logger.info(f"🎯 TOOL_INVOKED: get_agent_by_name with name: '{agent_name}'")
 
     try:
-        all_agents = await list_all_agents()
-
-        # Search by name or ID
-        from ..agent import AgentInterface
-
-        for agent_card in all_agents:
-            agent_interface = AgentInterface(agent_card)
-            if agent_interface.name == agent_name or agent_interface.agent_id == agent_name:
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"Found agent '{agent_name}' in registry")
-                return agent_card
+        # Search by name or ID; a miss on a cached snapshot refreshes it once before failing
+        by_key, available_names, cached = await _get_agent_index()
+        agent_card = by_key.get(agent_name)
+        if agent_card is None and cached:
+            by_key, available_names, _ = await _get_agent_index(refresh=True)
+            agent_card = by_key.get(agent_name)
+
+        if agent_card is not None:
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"Found agent '{agent_name}' in registry")
+            # The indexed card is shared by every caller until the snapshot expires, so hand out a copy
+            result = MantisAgentCard()
+            result.CopyFrom(agent_card)
+            return result
 
         # No fallbacks - fail fast if agent not found in registry
 
         # Agent not found
-        available_names = []
-        for agent_card in all_agents:
-            agent_interface = AgentInterface(agent_card)
-            available_names.append(agent_interface.name)
-
         available_str = ", ".join(available_names[:10])
         if len(available_names) > 10:
             available_str += "..."
@@ -0,0 +1,69 @@
+"""
+Small in-process caches shared by Mantis tools.
+
+Tools memoize slow lookups (registry searches, web searches, clones, project listings) for a short
+time so repeated calls within one conversation don't redo the same network round trip.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """A bounded LRU cache whose entries expire ``ttl`` seconds after they are stored.
+
+    Expired entries are dropped when read, and swept from the whole cache at most once per TTL
+    on writes so stale entries don't linger until they are evicted.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._next_sweep = 0.0
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value for ``key``, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Cache ``value`` under ``key``, evicting the least recently used entry when full."""
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            for expired_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[expired_key]
+            self._next_sweep = now + self.ttl
+
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._next_sweep = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over cached keys, least recently used first."""
+        return iter(list(self._entries))
+
+
+def credential_digest(secret: str) -> str:
+    """Hash a credential for use in cache keys, so raw tokens are never held as dictionary keys."""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
@@ -4,11 +4,15 @@ Simplified to only support pydantic-ai integration.
 """
 
 import logging
+import os
 import tempfile
 from pathlib import Path
 import subprocess
+from typing import Optional
 from urllib.parse import urlparse
 
+from .cache import TTLCache
+
 # Observability imports
 try:
     from ..observability import get_structured_logger
@@ -26,6 +30,32 @@ else:
     obs_logger = None  # type: ignore
 
 
+# Cloning dominates analysis cost, so recent analyses are reused: normalized repo URL -> analysis details
+_ANALYSIS_CACHE: TTLCache[str, str] = TTLCache(ttl=300.0, max_entries=64)
+
+
+def _git_scratch_dir() -> Optional[str]:
+    """Pick where temporary clones are checked out.
+
+    Defaults to the system temp dir. MANTIS_GIT_SCRATCH_DIR can point clones at e.g. a tmpfs mount;
+    it is opt-in because tmpfs is often small (64MB /dev/shm in Docker) and clones would sit in RAM.
+    """
+    return os.environ.get("MANTIS_GIT_SCRATCH_DIR") or None
+
+
+def _normalize_repo_url(repo_url: str) -> str:
+    """Normalize a repository URL so trivially different spellings share a cache entry.
+
+    Only the scheme and host are case-insensitive; the path is kept as-is because hosts may
+    treat owner/repo names case-sensitively.
+    """
+    parsed = urlparse(repo_url.strip())
+    path = parsed.path.rstrip("/")
+    if path.endswith(".git"):
+        path = path[:-4]
+    return parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), path=path).geturl()
+
+
 async def git_analyze_repository(repo_url: str) -> str:
     """Analyze a git repository and return information about its structure.
 
@@ -51,10 +81,18 @@ async def git_analyze_repository(repo_url: str) -> str:
         if any(blocked in parsed.netloc for blocked in blocked_domains):
             return f"Error: Blocked domain in repository URL: {parsed.netloc}"
 
+        repo_name = repo_url.split("/")[-1].replace(".git", "")
+        # The header echoes this caller's URL; only the clone-derived details are cached
+        header = [f"**Repository: {repo_name}**", f"URL: {repo_url}"]
+
+        cache_key = _normalize_repo_url(repo_url)
+        cached = _ANALYSIS_CACHE.get(cache_key)
+        if cached is not None:
+            return "\\n".join(header + [cached])
+
         # Create temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(prefix="mantis-git-", dir=_git_scratch_dir()) as temp_dir:
             temp_path = Path(temp_dir)
-            repo_name = repo_url.split("/")[-1].replace(".git", "")
             clone_path = temp_path / repo_name
 
             # Clone repository (shallow clone for speed)
@@ -67,8 +105,6 @@ async def git_analyze_repository(repo_url: str) -> str:
 
             # Get basic repo info
             repo_info = []
-            repo_info.append(f"**Repository: {repo_name}**")
-            repo_info.append(f"URL: {repo_url}")
 
             # Get current branch and commit
             try:
@@ -92,7 +128,17 @@ async def git_analyze_repository(repo_url: str) -> str:
 
             # Count files and estimate size
             try:
-                file_count = sum(1 for _ in clone_path.rglob("*") if _.is_file() and not _.name.startswith(".git"))
+                # scandir entries carry their file type, so unlike rglob this doesn't build and stat a Path
+                # per file; the count is unchanged (files under .git/ still count, .git* names do not)
+                file_count = 0
+                pending = [str(clone_path)]
+                while pending:
+                    with os.scandir(pending.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file() and not entry.name.startswith(".git"):
+                                file_count += 1
                 repo_info.append(f"Files: {file_count}")
 
                 # Get directory size (rough estimate)
@@ -107,12 +153,13 @@ async def git_analyze_repository(repo_url: str) -> str:
                     obs_logger.warning(f"Filesystem operation failure for {repo_url}: {e}")
                 # Continue with analysis despite filesystem operation failure
 
-            result_text = "\\n".join(repo_info)
+            details = "\\n".join(repo_info)
 
             if OBSERVABILITY_AVAILABLE and obs_logger:
                 obs_logger.info(f"Git repository analysis completed for {repo_name}")
 
-            return result_text
+            _ANALYSIS_CACHE.set(cache_key, details)
+            return "\\n".join(header + [details])
 
     except Exception as e:
         error_msg = f"Error analyzing repository {repo_url}: {str(e)}"
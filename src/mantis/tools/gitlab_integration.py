@@ -5,7 +5,11 @@ Simplified to only support pydantic-ai integration.
 
 import logging
 import aiohttp
-from typing import Optional
+import orjson
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import TTLCache, credential_digest
+from .http_session import SharedSession, pooled_session
 
 # Observability imports
 try:
@@ -24,6 +28,14 @@ else:
     obs_logger = None  # type: ignore
 
 
+# Shared session so repeated API calls reuse pooled keep-alive connections instead of re-handshaking TLS
+_SESSION = SharedSession(pooled_session)
+
+# Project listings change rarely, so non-empty ones are memoized briefly:
+# (api_url, sha256(access_token), search) -> projects
+_PROJECTS_CACHE: TTLCache[Tuple[Optional[str], ...], List[Dict[str, Any]]] = TTLCache(ttl=60.0, max_entries=64)
+
+
 async def gitlab_list_projects(gitlab_url: str, access_token: str, search: Optional[str] = None) -> str:
     """List GitLab projects accessible to the authenticated user.
 
@@ -46,33 +58,39 @@ async def gitlab_list_projects(gitlab_url: str, access_token: str, search: Optio
         if search:
             params["search"] = search
 
-        async with aiohttp.ClientSession() as session:
+        cache_key = (api_url, credential_digest(access_token), search)
+        projects = _PROJECTS_CACHE.get(cache_key)
+        if projects is None:
+            session = await _SESSION.get()
             async with session.get(api_url, headers=headers, params=params) as response:
                 if response.status != 200:
                     return f"Failed to fetch GitLab projects: HTTP {response.status}"
 
-                projects = await response.json()
+                projects = orjson.loads(await response.read())
+            # An empty listing may just mean access hasn't been granted yet, so only non-empty ones are cached
+            if projects:
+                _PROJECTS_CACHE.set(cache_key, projects)
 
-                if not projects:
-                    search_info = f" matching '{search}'" if search else ""
-                    return f"No GitLab projects found{search_info}"
+        if not projects:
+            search_info = f" matching '{search}'" if search else ""
+            return f"No GitLab projects found{search_info}"
 
-                # Format results for LLM
-                formatted_results = []
-                for project in projects:
-                    name = project.get("name", "Unknown")
-                    description = project.get("description", "No description")
-                    web_url = project.get("web_url", "")
-                    namespace = project.get("namespace", {}).get("full_path", "")
+        # Format results for LLM
+        formatted_results = []
+        for project in projects:
+            name = project.get("name", "Unknown")
+            description = project.get("description", "No description")
+            web_url = project.get("web_url", "")
+            namespace = project.get("namespace", {}).get("full_path", "")
 
-                    formatted_results.append(f"- **{name}** ({namespace}): {description}\n  URL: {web_url}")
+            formatted_results.append(f"- **{name}** ({namespace}): {description}\n  URL: {web_url}")
 
-                result_text = f"Found {len(projects)} GitLab projects:\n\n" + "\n\n".join(formatted_results)
+        result_text = f"Found {len(projects)} GitLab projects:\n\n" + "\n\n".join(formatted_results)
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"GitLab projects listed: {len(projects)} results")
+        if OBSERVABILITY_AVAILABLE and obs_logger:
+            obs_logger.info(f"GitLab projects listed: {len(projects)} results")
 
-                return result_text
+        return result_text
 
     except Exception as e:
         error_msg = f"Error listing GitLab projects: {str(e)}"
@@ -106,38 +124,38 @@ async def gitlab_list_issues(gitlab_url: str, access_token: str, project_id: str
         headers = {"Authorization": f"Bearer {access_token}"}
         params = {"per_page": "20", "state": state}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_url, headers=headers, params=params) as response:
-                if response.status != 200:
-                    return f"Failed to fetch GitLab issues: HTTP {response.status}"
+        session = await _SESSION.get()
+        async with session.get(api_url, headers=headers, params=params) as response:
+            if response.status != 200:
+                return f"Failed to fetch GitLab issues: HTTP {response.status}"
 
-                issues = await response.json()
+            issues = orjson.loads(await response.read())
 
-                if not issues:
-                    return f"No {state} issues found in GitLab project {project_id}"
+            if not issues:
+                return f"No {state} issues found in GitLab project {project_id}"
 
-                # Format results for LLM
-                formatted_results = []
-                for issue in issues:
-                    title = issue.get("title", "Untitled")
-                    iid = issue.get("iid", "?")
-                    state = issue.get("state", "unknown")
-                    web_url = issue.get("web_url", "")
-                    author = issue.get("author", {}).get("name", "Unknown")
-                    created = issue.get("created_at", "").split("T")[0] if issue.get("created_at") else ""
-
-                    formatted_results.append(
-                        f"- **#{iid}: {title}** [{state}]\n  Author: {author}, Created: {created}\n  URL: {web_url}"
-                    )
+            # Format results for LLM
+            formatted_results = []
+            for issue in issues:
+                title = issue.get("title", "Untitled")
+                iid = issue.get("iid", "?")
+                state = issue.get("state", "unknown")
+                web_url = issue.get("web_url", "")
+                author = issue.get("author", {}).get("name", "Unknown")
+                created = issue.get("created_at", "").split("T")[0] if issue.get("created_at") else ""
 
-                result_text = f"Found {len(issues)} {state} issues in project {project_id}:\n\n" + "\n\n".join(
-                    formatted_results
+                formatted_results.append(
+                    f"- **#{iid}: {title}** [{state}]\n  Author: {author}, Created: {created}\n  URL: {web_url}"
                 )
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"GitLab issues listed: {len(issues)} results")
+            result_text = f"Found {len(issues)} {state} issues in project {project_id}:\n\n" + "\n\n".join(
+                formatted_results
+            )
+
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"GitLab issues listed: {len(issues)} results")
 
-                return result_text
+            return result_text
 
     except Exception as e:
         error_msg = f"Error listing GitLab issues for {project_id}: {str(e)}"
@@ -177,23 +195,23 @@ async def gitlab_create_issue(
         if description:
             data["description"] = description
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(api_url, headers=headers, data=data) as response:
-                if response.status not in [200, 201]:
-                    return f"Failed to create GitLab issue: HTTP {response.status}"
+        session = await _SESSION.get()
+        async with session.post(api_url, headers=headers, data=data) as response:
+            if response.status not in [200, 201]:
+                return f"Failed to create GitLab issue: HTTP {response.status}"
 
-                issue = await response.json()
+            issue = orjson.loads(await response.read())
 
-                title = issue.get("title", "Untitled")
-                iid = issue.get("iid", "?")
-                web_url = issue.get("web_url", "")
+            title = issue.get("title", "Untitled")
+            iid = issue.get("iid", "?")
+            web_url = issue.get("web_url", "")
 
-                result_msg = f"Successfully created GitLab issue #{iid}: {title}\nURL: {web_url}"
+            result_msg = f"Successfully created GitLab issue #{iid}: {title}\nURL: {web_url}"
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"GitLab issue created: #{iid}")
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"GitLab issue created: #{iid}")
 
-                return result_msg
+            return result_msg
 
     except Exception as e:
         error_msg = f"Error creating GitLab issue in {project_id}: {str(e)}"
@@ -226,50 +244,53 @@ async def gitlab_get_issue(gitlab_url: str, access_token: str, project_id: str,
         api_url = f"{gitlab_url.rstrip('/')}/api/v4/projects/{encoded_project_id}/issues/{issue_iid}"
         headers = {"Authorization": f"Bearer {access_token}"}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_url, headers=headers) as response:
-                if response.status == 404:
-                    return f"GitLab issue #{issue_iid} not found in project {project_id}"
-                elif response.status != 200:
-                    return f"Failed to fetch GitLab issue: HTTP {response.status}"
-
-                issue = await response.json()
-
-                # Format detailed issue information
-                title = issue.get("title", "Untitled")
-                iid = issue.get("iid", "?")
-                state = issue.get("state", "unknown")
-                description = issue.get("description", "No description")
-                web_url = issue.get("web_url", "")
-                author = issue.get("author", {}).get("name", "Unknown")
-                assignee = issue.get("assignee")
-                assignee_name = assignee.get("name", "Unassigned") if assignee else "Unassigned"
-                created = issue.get("created_at", "").split("T")[0] if issue.get("created_at") else ""
-                updated = issue.get("updated_at", "").split("T")[0] if issue.get("updated_at") else ""
-                labels = issue.get("labels", [])
-                milestone = issue.get("milestone")
-                milestone_title = milestone.get("title", "No milestone") if milestone else "No milestone"
-
-                # Get issue notes/comments
-                notes_url = f"{gitlab_url.rstrip('/')}/api/v4/projects/{encoded_project_id}/issues/{issue_iid}/notes"
-                notes_text = ""
-                try:
-                    async with session.get(notes_url, headers=headers) as notes_response:
-                        if notes_response.status == 200:
-                            notes = await notes_response.json()
-                            if notes:
-                                notes_text = f"\n\n**Comments ({len(notes)}):**\n"
-                                for note in notes[:5]:  # Limit to 5 most recent comments
-                                    note_author = note.get("author", {}).get("name", "Unknown")
-                                    note_body = note.get("body", "")
-                                    note_created = (
-                                        note.get("created_at", "").split("T")[0] if note.get("created_at") else ""
-                                    )
-                                    notes_text += f"\n- **{note_author}** ({note_created}): {note_body[:200]}{'...' if len(note_body) > 200 else ''}"
-                except Exception:
-                    pass  # Skip comments if they fail to load
-
-                result_text = f"""**GitLab Issue #{iid}: {title}** [{state}]
+        session = await _SESSION.get()
+        async with session.get(api_url, headers=headers) as response:
+            if response.status == 404:
+                return f"GitLab issue #{issue_iid} not found in project {project_id}"
+            elif response.status != 200:
+                return f"Failed to fetch GitLab issue: HTTP {response.status}"
+
+            issue = orjson.loads(await response.read())
+
+            # Format detailed issue information
+            title = issue.get("title", "Untitled")
+            iid = issue.get("iid", "?")
+            state = issue.get("state", "unknown")
+            description = issue.get("description", "No description")
+            web_url = issue.get("web_url", "")
+            author = issue.get("author", {}).get("name", "Unknown")
+            assignee = issue.get("assignee")
+            assignee_name = assignee.get("name", "Unassigned") if assignee else "Unassigned"
+            created = issue.get("created_at", "").split("T")[0] if issue.get("created_at") else ""
+            updated = issue.get("updated_at", "").split("T")[0] if issue.get("updated_at") else ""
+            labels = issue.get("labels", [])
+            milestone = issue.get("milestone")
+            milestone_title = milestone.get("title", "No milestone") if milestone else "No milestone"
+
+            # Get issue notes/comments
+            notes_url = f"{gitlab_url.rstrip('/')}/api/v4/projects/{encoded_project_id}/issues/{issue_iid}/notes"
+            notes_text = ""
+            try:
+                async with session.get(notes_url, headers=headers) as notes_response:
+                    if notes_response.status == 200:
+                        notes = orjson.loads(await notes_response.read())
+                        if notes:
+                            note_lines = []
+                            for note in notes[:5]:  # Limit to 5 most recent comments
+                                note_author = note.get("author", {}).get("name", "Unknown")
+                                note_body = note.get("body", "")
+                                note_created = (
+                                    note.get("created_at", "").split("T")[0] if note.get("created_at") else ""
+                                )
+                                note_lines.append(
+                                    f"\n- **{note_author}** ({note_created}): {note_body[:200]}{'...' if len(note_body) > 200 else ''}"
+                                )
+                            notes_text = f"\n\n**Comments ({len(notes)}):**\n" + "".join(note_lines)
+            except Exception:
+                pass  # Skip comments if they fail to load
+
+            result_text = f"""**GitLab Issue #{iid}: {title}** [{state}]
 
 **Project:** {project_id}
 **Author:** {author}
@@ -284,10 +305,10 @@ async def gitlab_get_issue(gitlab_url: str, access_token: str, project_id: str,
 {description}
 {notes_text}"""
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"GitLab issue #{iid} retrieved successfully")
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"GitLab issue #{iid} retrieved successfully")
 
-                return result_text
+            return result_text
 
     except Exception as e:
         error_msg = f"Error getting GitLab issue #{issue_iid} in {project_id}: {str(e)}"
@@ -0,0 +1,76 @@
+"""
+Shared aiohttp sessions for Mantis tools.
+
+Each tool module owns one SharedSession so repeated calls reuse pooled keep-alive connections.
+A session is bound to the event loop that created it: close_all_sessions() must run before that
+loop shuts down, which run_async() and the server shutdown hooks take care of.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+_SHARED_SESSIONS: List["SharedSession"] = []
+
+
+def pooled_session(**kwargs: Any) -> aiohttp.ClientSession:
+    """Build a session with a sized keep-alive pool; extra keyword arguments go to ClientSession."""
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=75)
+    return aiohttp.ClientSession(connector=connector, **kwargs)
+
+
+class SharedSession:
+    """A lazily created aiohttp session, replaced (and the stale one closed) when the event loop changes."""
+
+    def __init__(self, factory: Callable[[], aiohttp.ClientSession]) -> None:
+        self._factory = factory
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        _SHARED_SESSIONS.append(self)
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Get the session for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is None or session.closed or self._loop is not loop:
+            stale = session
+            # Swap in the new session before awaiting so concurrent callers never build a second one
+            session = self._session = self._factory()
+            self._loop = loop
+            if stale is not None:
+                await _close_quietly(stale)
+        return session
+
+    async def close(self) -> None:
+        """Close the session if one is open."""
+        session, self._session, self._loop = self._session, None, None
+        if session is not None:
+            await _close_quietly(session)
+
+
+async def _close_quietly(session: aiohttp.ClientSession) -> None:
+    """Close a session, logging rather than raising if its transports are already gone."""
+    if session.closed:
+        return
+    try:
+        await session.close()
+    except Exception as e:
+        logger.warning(f"Failed to close shared HTTP session: {e}")
+
+
+async def close_all_sessions() -> None:
+    """Close every shared tool session; call before the event loop that used them shuts down."""
+    for shared in _SHARED_SESSIONS:
+        await shared.close()
+
+
+@asynccontextmanager
+async def close_sessions_on_shutdown(app: Any) -> AsyncIterator[None]:
+    """ASGI lifespan that closes the shared tool sessions when the server stops."""
+    yield
+    await close_all_sessions()
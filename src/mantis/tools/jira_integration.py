@@ -5,7 +5,11 @@ Simplified to only support pydantic-ai integration.
 
 import logging
 import aiohttp
-from typing import Optional
+import orjson
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import TTLCache, credential_digest
+from .http_session import SharedSession, pooled_session
 
 # Observability imports
 try:
@@ -24,6 +28,14 @@ else:
     obs_logger = None  # type: ignore
 
 
+# Shared session so repeated API calls reuse pooled keep-alive connections instead of re-handshaking TLS
+_SESSION = SharedSession(pooled_session)
+
+# Project listings change rarely, so non-empty ones are memoized briefly:
+# (api_url, username, sha256(api_token)) -> projects
+_PROJECTS_CACHE: TTLCache[Tuple[Optional[str], ...], List[Dict[str, Any]]] = TTLCache(ttl=60.0, max_entries=64)
+
+
 async def jira_list_projects(jira_url: str, username: str, api_token: str, project_key: Optional[str] = None) -> str:
     """List Jira projects accessible to the authenticated user.
 
@@ -45,37 +57,43 @@ async def jira_list_projects(jira_url: str, username: str, api_token: str, proje
         # Use HTTP Basic Auth with username and API token
         auth = aiohttp.BasicAuth(username, api_token)
 
-        async with aiohttp.ClientSession() as session:
+        cache_key = (api_url, username, credential_digest(api_token))
+        projects = _PROJECTS_CACHE.get(cache_key)
+        if projects is None:
+            session = await _SESSION.get()
             async with session.get(api_url, auth=auth) as response:
                 if response.status != 200:
                     return f"Failed to fetch Jira projects: HTTP {response.status}"
 
-                projects = await response.json()
+                projects = orjson.loads(await response.read())
+            # An empty listing may just mean access hasn't been granted yet, so only non-empty ones are cached
+            if projects:
+                _PROJECTS_CACHE.set(cache_key, projects)
 
-                # Filter by project key if specified
-                if project_key:
-                    projects = [p for p in projects if p.get("key", "").upper() == project_key.upper()]
+        # Filter by project key if specified
+        if project_key:
+            projects = [p for p in projects if p.get("key", "").upper() == project_key.upper()]
 
-                if not projects:
-                    filter_info = f" with key '{project_key}'" if project_key else ""
-                    return f"No Jira projects found{filter_info}"
+        if not projects:
+            filter_info = f" with key '{project_key}'" if project_key else ""
+            return f"No Jira projects found{filter_info}"
 
-                # Format results for LLM
-                formatted_results = []
-                for project in projects[:20]:  # Limit to 20 results
-                    key = project.get("key", "Unknown")
-                    name = project.get("name", "Unknown")
-                    description = project.get("description", "No description")
-                    project_url = project.get("self", "")
+        # Format results for LLM
+        formatted_results = []
+        for project in projects[:20]:  # Limit to 20 results
+            key = project.get("key", "Unknown")
+            name = project.get("name", "Unknown")
+            description = project.get("description", "No description")
+            project_url = project.get("self", "")
 
-                    formatted_results.append(f"- **{key}: {name}**: {description}\n  URL: {project_url}")
+            formatted_results.append(f"- **{key}: {name}**: {description}\n  URL: {project_url}")
 
-                result_text = f"Found {len(projects)} Jira projects:\n\n" + "\n\n".join(formatted_results)
+        result_text = f"Found {len(projects)} Jira projects:\n\n" + "\n\n".join(formatted_results)
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"Jira projects listed: {len(projects)} results")
+        if OBSERVABILITY_AVAILABLE and obs_logger:
+            obs_logger.info(f"Jira projects listed: {len(projects)} results")
 
-                return result_text
+        return result_text
 
     except Exception as e:
         error_msg = f"Error listing Jira projects: {str(e)}"
@@ -115,46 +133,46 @@ async def jira_list_issues(jira_url: str, username: str, api_token: str, project
         # Use HTTP Basic Auth with username and API token
         auth = aiohttp.BasicAuth(username, api_token)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_url, params=params, auth=auth) as response:
-                if response.status != 200:
-                    return f"Failed to fetch Jira issues: HTTP {response.status}"
-
-                data = await response.json()
-                issues = data.get("issues", [])
-
-                if not issues:
-                    return f"No {status} issues found in Jira project {project_key}"
-
-                # Format results for LLM
-                formatted_results = []
-                for issue in issues:
-                    key = issue.get("key", "?")
-                    summary = issue["fields"].get("summary", "No summary")
-                    status_name = issue["fields"].get("status", {}).get("name", "Unknown")
-                    assignee = issue["fields"].get("assignee")
-                    assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
-                    created = issue["fields"].get("created", "").split("T")[0] if issue["fields"].get("created") else ""
-                    priority = (
-                        issue["fields"].get("priority", {}).get("name", "Unknown")
-                        if issue["fields"].get("priority")
-                        else "Unknown"
-                    )
+        session = await _SESSION.get()
+        async with session.get(api_url, params=params, auth=auth) as response:
+            if response.status != 200:
+                return f"Failed to fetch Jira issues: HTTP {response.status}"
 
-                    issue_url = f"{jira_url.rstrip('/')}/browse/{key}"
+            data = orjson.loads(await response.read())
+            issues = data.get("issues", [])
 
-                    formatted_results.append(
-                        f"- **{key}: {summary}** [{status_name}]\n  Assignee: {assignee_name}, Priority: {priority}, Created: {created}\n  URL: {issue_url}"
-                    )
+            if not issues:
+                return f"No {status} issues found in Jira project {project_key}"
 
-                result_text = f"Found {len(issues)} {status} issues in project {project_key}:\n\n" + "\n\n".join(
-                    formatted_results
+            # Format results for LLM
+            formatted_results = []
+            for issue in issues:
+                key = issue.get("key", "?")
+                summary = issue["fields"].get("summary", "No summary")
+                status_name = issue["fields"].get("status", {}).get("name", "Unknown")
+                assignee = issue["fields"].get("assignee")
+                assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
+                created = issue["fields"].get("created", "").split("T")[0] if issue["fields"].get("created") else ""
+                priority = (
+                    issue["fields"].get("priority", {}).get("name", "Unknown")
+                    if issue["fields"].get("priority")
+                    else "Unknown"
                 )
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"Jira issues listed: {len(issues)} results")
+                issue_url = f"{jira_url.rstrip('/')}/browse/{key}"
 
-                return result_text
+                formatted_results.append(
+                    f"- **{key}: {summary}** [{status_name}]\n  Assignee: {assignee_name}, Priority: {priority}, Created: {created}\n  URL: {issue_url}"
+                )
+
+            result_text = f"Found {len(issues)} {status} issues in project {project_key}:\n\n" + "\n\n".join(
+                formatted_results
+            )
+
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"Jira issues listed: {len(issues)} results")
+
+            return result_text
 
     except Exception as e:
         error_msg = f"Error listing Jira issues for {project_key}: {str(e)}"
@@ -203,23 +221,23 @@ async def jira_create_issue(
         # Use HTTP Basic Auth with username and API token
         auth = aiohttp.BasicAuth(username, api_token)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(api_url, json=issue_data, auth=auth) as response:
-                if response.status not in [200, 201]:
-                    error_text = await response.text()
-                    return f"Failed to create Jira issue: HTTP {response.status} - {error_text}"
+        session = await _SESSION.get()
+        async with session.post(api_url, json=issue_data, auth=auth) as response:
+            if response.status not in [200, 201]:
+                error_text = await response.text()
+                return f"Failed to create Jira issue: HTTP {response.status} - {error_text}"
 
-                result = await response.json()
+            result = orjson.loads(await response.read())
 
-                issue_key = result.get("key", "Unknown")
-                issue_url = f"{jira_url.rstrip('/')}/browse/{issue_key}"
+            issue_key = result.get("key", "Unknown")
+            issue_url = f"{jira_url.rstrip('/')}/browse/{issue_key}"
 
-                result_msg = f"Successfully created Jira issue {issue_key}: {summary}\nURL: {issue_url}"
+            result_msg = f"Successfully created Jira issue {issue_key}: {summary}\nURL: {issue_url}"
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"Jira issue created: {issue_key}")
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"Jira issue created: {issue_key}")
 
-                return result_msg
+            return result_msg
 
     except Exception as e:
         error_msg = f"Error creating Jira issue in {project_key}: {str(e)}"
@@ -253,48 +271,51 @@ async def jira_get_issue(jira_url: str, username: str, api_token: str, issue_key
         # Use HTTP Basic Auth with username and API token
         auth = aiohttp.BasicAuth(username, api_token)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_url, params=params, auth=auth) as response:
-                if response.status == 404:
-                    return f"Jira issue {issue_key} not found"
-                elif response.status != 200:
-                    return f"Failed to fetch Jira issue: HTTP {response.status}"
-
-                issue = await response.json()
-                fields = issue.get("fields", {})
-
-                # Format detailed issue information
-                key = issue.get("key", "Unknown")
-                summary = fields.get("summary", "No summary")
-                description = fields.get("description", "No description")
-                status = fields.get("status", {}).get("name", "Unknown")
-                assignee = fields.get("assignee")
-                assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
-                reporter = fields.get("reporter", {}).get("displayName", "Unknown")
-                created = fields.get("created", "").split("T")[0] if fields.get("created") else ""
-                updated = fields.get("updated", "").split("T")[0] if fields.get("updated") else ""
-                priority = fields.get("priority", {}).get("name", "Unknown") if fields.get("priority") else "Unknown"
-                labels = fields.get("labels", [])
-                components = [comp.get("name", "") for comp in fields.get("components", [])]
-                fix_versions = [ver.get("name", "") for ver in fields.get("fixVersions", [])]
-                resolution = fields.get("resolution")
-                resolution_name = resolution.get("name", "Unresolved") if resolution else "Unresolved"
-                resolution_date = fields.get("resolutiondate", "").split("T")[0] if fields.get("resolutiondate") else ""
-
-                issue_url = f"{jira_url.rstrip('/')}/browse/{key}"
-
-                # Get comments
-                comments_text = ""
-                comments = issue.get("fields", {}).get("comment", {}).get("comments", [])
-                if comments:
-                    comments_text = f"\n\n**Comments ({len(comments)}):**\n"
-                    for comment in comments[-5:]:  # Last 5 comments
-                        comment_author = comment.get("author", {}).get("displayName", "Unknown")
-                        comment_body = comment.get("body", "")
-                        comment_created = comment.get("created", "").split("T")[0] if comment.get("created") else ""
-                        comments_text += f"\n- **{comment_author}** ({comment_created}): {comment_body[:200]}{'...' if len(comment_body) > 200 else ''}"
+        session = await _SESSION.get()
+        async with session.get(api_url, params=params, auth=auth) as response:
+            if response.status == 404:
+                return f"Jira issue {issue_key} not found"
+            elif response.status != 200:
+                return f"Failed to fetch Jira issue: HTTP {response.status}"
+
+            issue = orjson.loads(await response.read())
+            fields = issue.get("fields", {})
+
+            # Format detailed issue information
+            key = issue.get("key", "Unknown")
+            summary = fields.get("summary", "No summary")
+            description = fields.get("description", "No description")
+            status = fields.get("status", {}).get("name", "Unknown")
+            assignee = fields.get("assignee")
+            assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
+            reporter = fields.get("reporter", {}).get("displayName", "Unknown")
+            created = fields.get("created", "").split("T")[0] if fields.get("created") else ""
+            updated = fields.get("updated", "").split("T")[0] if fields.get("updated") else ""
+            priority = fields.get("priority", {}).get("name", "Unknown") if fields.get("priority") else "Unknown"
+            labels = fields.get("labels", [])
+            components = [comp.get("name", "") for comp in fields.get("components", [])]
+            fix_versions = [ver.get("name", "") for ver in fields.get("fixVersions", [])]
+            resolution = fields.get("resolution")
+            resolution_name = resolution.get("name", "Unresolved") if resolution else "Unresolved"
+            resolution_date = fields.get("resolutiondate", "").split("T")[0] if fields.get("resolutiondate") else ""
+
+            issue_url = f"{jira_url.rstrip('/')}/browse/{key}"
+
+            # Get comments
+            comments_text = ""
+            comments = issue.get("fields", {}).get("comment", {}).get("comments", [])
+            if comments:
+                comment_lines = []
+                for comment in comments[-5:]:  # Last 5 comments
+                    comment_author = comment.get("author", {}).get("displayName", "Unknown")
+                    comment_body = comment.get("body", "")
+                    comment_created = comment.get("created", "").split("T")[0] if comment.get("created") else ""
+                    comment_lines.append(
+                        f"\n- **{comment_author}** ({comment_created}): {comment_body[:200]}{'...' if len(comment_body) > 200 else ''}"
+                    )
+                comments_text = f"\n\n**Comments ({len(comments)}):**\n" + "".join(comment_lines)
 
-                result_text = f"""**Jira Issue {key}: {summary}** [{status}]
+            result_text = f"""**Jira Issue {key}: {summary}** [{status}]
 
 **Reporter:** {reporter}
 **Assignee:** {assignee_name}
@@ -312,10 +333,10 @@ async def jira_get_issue(jira_url: str, username: str, api_token: str, issue_key
 {description}
 {comments_text}"""
 
-                if OBSERVABILITY_AVAILABLE and obs_logger:
-                    obs_logger.info(f"Jira issue {key} retrieved successfully")
+            if OBSERVABILITY_AVAILABLE and obs_logger:
+                obs_logger.info(f"Jira issue {key} retrieved successfully")
 
-                return result_text
+            return result_text
 
     except Exception as e:
         error_msg = f"Error getting Jira issue {issue_key}: {str(e)}"
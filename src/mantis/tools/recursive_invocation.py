@@ -2,11 +2,21 @@
 Clean Recursive Agent Invocation
 
 Implements recursive agent calls with proper protobuf SimulationOutput aggregation.
-No global state, clean dependency injection.
+The orchestrator is passed in explicitly; the only module-level state is per-process caching:
+
+- _REG_CACHE: short-lived snapshot of registry agent names and IDs used for validation
+- _INFLIGHT_A2A_CALLS: direct A2A requests currently running, so identical concurrent calls share one
+- _PROC_TAG / _RPC_SEQ: process tag and counter that generate JSON-RPC request IDs
+- _AGENT_URL_MAP and _EMPTY_CTX: read-only constants
 """
 
 import asyncio
-from typing import Dict, Optional, TYPE_CHECKING
+import itertools
+import logging
+import time
+import uuid
+import orjson
+from typing import AbstractSet, Dict, FrozenSet, Optional, Tuple, TYPE_CHECKING
 from ..observability.logger import get_structured_logger
 from ..core.orchestrator import current_agent_context
 from ..proto.mantis.v1 import mantis_core_pb2
@@ -17,6 +27,57 @@ if TYPE_CHECKING:
 
 logger = get_structured_logger(__name__)
 
+# Registry snapshot of agent names and IDs, cached briefly to avoid re-listing the registry per validation
+_REGISTRY_CACHE_TTL = 10.0
+_REG_CACHE: Optional[Tuple[float, FrozenSet[str]]] = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared read-only default for current_agent_context lookups, avoids allocating a dict per call
+_EMPTY_CTX: Dict[str, str] = {}
+
+# HOTFIX: Hardcoded direct A2A endpoints used by invoke_agent_by_name.
+# Simple fix: Just use port 9001 for all agents - they all work.
+# The agents will adapt their persona based on the query content.
+_AGENT_URL_MAP: Dict[str, str] = {
+    "John Malone": "http://localhost:9001",
+    "Niccolo Machiavelli": "http://localhost:9001",
+    "Steve Jobs": "http://localhost:9001",
+    "Peter Drucker": "http://localhost:9001",
+    "Chief Of Staff": "http://localhost:9001",
+    "Marcus Aurelius": "http://localhost:9001",
+    "John D Rockefeller": "http://localhost:9001",
+    "Cornelius Vanderbilt": "http://localhost:9001",
+    # All agents use the same port - agent adapts based on query
+}
+
+
+class _InflightA2ACall:
+    """A shared outbound A2A request and the number of callers currently awaiting it."""
+
+    def __init__(self, task: "asyncio.Task[mantis_core_pb2.SimulationOutput]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+# In-flight direct A2A calls keyed by (agent_url, agent_name, query, context), used to coalesce duplicates
+_INFLIGHT_A2A_CALLS: Dict[Tuple[str, str, str, Optional[str]], _InflightA2ACall] = {}
+
+# Upper bound on concurrent agent invocations in invoke_multiple_agents
+_MAX_CONCURRENT_AGENT_CALLS = 16
+
+# Client-error statuses worth polling through (request timeout, rate limiting); other 4xx fail immediately
+_RETRYABLE_POLL_STATUSES = frozenset({408, 429})
+
+# JSON-RPC request IDs only need to be unique per session: a per-process tag plus a counter avoids a uuid4 per call
+_PROC_TAG = uuid.uuid4().hex[:8]
+_RPC_SEQ = itertools.count()
+
+
+def _next_rpc_id() -> str:
+    """Return a process-unique JSON-RPC request ID."""
+    return f"{_PROC_TAG}-{next(_RPC_SEQ)}"
+
 
 async def invoke_agent_by_url(
     agent_url: str,
@@ -44,7 +105,7 @@ async def invoke_agent_by_url(
     """
     from .base import log_tool_invocation, log_tool_result
 
-    agent_ctx = current_agent_context.get({})
+    agent_ctx = current_agent_context.get(_EMPTY_CTX)
     invoking_agent = agent_ctx.get("agent_name", "unknown")
     task_id = agent_ctx.get("task_id", "unknown")
     context_id = agent_ctx.get("context_id", "unknown")
@@ -57,16 +118,17 @@ async def invoke_agent_by_url(
         {"agent_url": agent_url, "agent_name": display_name, "query_length": len(query)},
     )
 
-    logger.info(
-        "Invoking agent directly by URL",
-        structured_data={
-            "invoking_agent": invoking_agent,
-            "target_url": agent_url,
-            "target_agent": display_name,
-            "task_id": task_id,
-            "context_id": context_id,
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Invoking agent directly by URL",
+            structured_data={
+                "invoking_agent": invoking_agent,
+                "target_url": agent_url,
+                "target_agent": display_name,
+                "task_id": task_id,
+                "context_id": context_id,
+            },
+        )
 
     try:
         # Use the existing direct A2A call function
@@ -87,15 +149,16 @@ async def invoke_agent_by_url(
             },
         )
 
-        logger.info(
-            "Successfully completed direct agent invocation by URL",
-            structured_data={
-                "invoking_agent": invoking_agent,
-                "target_url": agent_url,
-                "target_agent": display_name,
-                "success": True,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Successfully completed direct agent invocation by URL",
+                structured_data={
+                    "invoking_agent": invoking_agent,
+                    "target_url": agent_url,
+                    "target_agent": display_name,
+                    "success": True,
+                },
+            )
 
         return result
 
@@ -126,7 +189,7 @@ async def invoke_agent_by_name(
     Uses proper protobuf SimulationOutput with nested results aggregation.
 
     Args:
-        agent_name: Agent to invoke (must exist in registry)
+        agent_name: Agent to invoke (hardcoded A2A agent, or must exist in registry)
         query: Query to send to agent
         orchestrator: Orchestrator instance for execution
         context: Optional context
@@ -136,85 +199,93 @@ async def invoke_agent_by_name(
         Complete SimulationOutput from the invoked agent
 
     Raises:
-        ValueError: If agent not found in registry
+        ValueError: If agent is not hardcoded and not found in registry
         Exception: If execution fails
     """
-    agent_ctx = current_agent_context.get({})
+    agent_ctx = current_agent_context.get(_EMPTY_CTX)
     invoking_agent = agent_ctx.get("agent_name", "unknown")
     task_id = agent_ctx.get("task_id", "unknown")
     context_id = agent_ctx.get("context_id", "unknown")
 
-    # Validate agent exists in registry
-    await _validate_agent_exists(agent_name)
-
     # HOTFIX: Bypass registry complexity - hardcode agent URLs for basic coordination
     # This is a temporary fix to get coordination working without registry dependency
 
-    logger.info(
-        "🔧 HOTFIX: Using hardcoded agent URLs, bypassing registry",
-        structured_data={
-            "invoking_agent": invoking_agent,
-            "target_agent": agent_name,
-            "original_max_depth": max_depth,
-        },
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "🔧 HOTFIX: Using hardcoded agent URLs, bypassing registry",
+            structured_data={
+                "invoking_agent": invoking_agent,
+                "target_agent": agent_name,
+                "original_max_depth": max_depth,
+            },
+        )
+
+    agent_url = _AGENT_URL_MAP.get(agent_name)
+    if agent_url is not None:
+        # Use direct A2A call instead of recursive simulation - no registry roundtrip needed,
+        # _call_agent_directly_a2a checks the endpoint is reachable
+        return await _call_agent_directly_a2a(agent_name=agent_name, agent_url=agent_url, query=query, context=context)
+
+    # Validate agent exists in registry before falling back to recursive simulation
+    await _validate_agent_exists(agent_name)
+
+    return await _invoke_via_recursive_sim(
+        agent_name=agent_name,
+        query=query,
+        orchestrator=orchestrator,
+        context=context,
+        invoking_agent=invoking_agent,
+        task_id=task_id,
+        context_id=context_id,
     )
 
-    # Simple fix: Just use port 9001 for all agents - they all work
-    # The agents will adapt their persona based on the query content
-    agent_url_map = {
-        "John Malone": "http://localhost:9001",
-        "Niccolo Machiavelli": "http://localhost:9001",
-        "Steve Jobs": "http://localhost:9001",
-        "Peter Drucker": "http://localhost:9001",
-        "Chief Of Staff": "http://localhost:9001",
-        "Marcus Aurelius": "http://localhost:9001",
-        "John D Rockefeller": "http://localhost:9001",
-        "Cornelius Vanderbilt": "http://localhost:9001",
-        # All agents use the same port - agent adapts based on query
-    }
-
-    if agent_name in agent_url_map:
-        # Use direct A2A call instead of recursive simulation
-        return await _call_agent_directly_a2a(
-            agent_name=agent_name, agent_url=agent_url_map[agent_name], query=query, context=context
-        )
 
+async def _invoke_via_recursive_sim(
+    agent_name: str,
+    query: str,
+    orchestrator: "SimulationOrchestrator",
+    context: Optional[str],
+    invoking_agent: str,
+    task_id: str,
+    context_id: str,
+) -> mantis_core_pb2.SimulationOutput:
+    """Fallback for agents without a direct A2A endpoint: run a nested simulation with max_depth=0."""
     # Fallback: Force max_depth to 0 for safety if not in hardcoded list
     max_depth = 0
     logger.warning(
         "Agent not in hardcoded list, using fallback with max_depth=0",
-        structured_data={"agent_name": agent_name, "available_agents": list(agent_url_map.keys())},
+        structured_data={"agent_name": agent_name, "available_agents": list(_AGENT_URL_MAP.keys())},
     )
 
-    logger.info(
-        "Invoking agent through recursive simulation",
-        structured_data={
-            "invoking_agent": invoking_agent,
-            "target_agent": agent_name,
-            "task_id": task_id,
-            "context_id": context_id,
-            "max_depth": max_depth,
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Invoking agent through recursive simulation",
+            structured_data={
+                "invoking_agent": invoking_agent,
+                "target_agent": agent_name,
+                "task_id": task_id,
+                "context_id": context_id,
+                "max_depth": max_depth,
+            },
+        )
 
     try:
         # Create recursive SimulationInput
-        from ..proto.mantis.v1 import mantis_core_pb2
         from ..tools.agent_registry import get_agent_by_name
 
-        simulation_input = mantis_core_pb2.SimulationInput()
-        simulation_input.context_id = f"{context_id}-recursive-{agent_name.lower().replace(' ', '-')}"
-        simulation_input.parent_context_id = context_id
-        simulation_input.query = f"""You are {agent_name}. Please provide your perspective on the following:
+        simulation_input = mantis_core_pb2.SimulationInput(
+            context_id=f"{context_id}-recursive-{agent_name.lower().replace(' ', '-')}",
+            parent_context_id=context_id,
+            query=f"""You are {agent_name}. Please provide your perspective on the following:
 
 {query}
 
 {f"Additional context: {context}" if context else ""}
 
-Please respond as {agent_name} would, drawing on your expertise and perspective. Keep your response focused and authentic to your role."""
-
-        simulation_input.execution_strategy = mantis_core_pb2.EXECUTION_STRATEGY_DIRECT
-        simulation_input.max_depth = max_depth
+Please respond as {agent_name} would, drawing on your expertise and perspective. Keep your response focused and authentic to your role.""",
+            execution_strategy=mantis_core_pb2.EXECUTION_STRATEGY_DIRECT,
+            max_depth=max_depth,
+        )
 
         # CRITICAL FIX: Specify which agent to use instead of defaulting to Chief of Staff
         try:
@@ -225,25 +296,26 @@ Please respond as {agent_name} would, drawing on your expertise and perspective.
 
                 agent_wrapper = AgentInterfaceWrapper(target_agent_card)
 
-                agent_spec = mantis_core_pb2.AgentSpec()
                 # Populate the mantis_core AgentInterface (not a2a AgentInterface!)
-                agent_spec.agent.agent_id = agent_wrapper.agent_id
-                agent_spec.agent.name = agent_wrapper.name
-                agent_spec.agent.description = agent_wrapper.description
-                agent_spec.agent.capabilities_summary = agent_wrapper.capabilities_summary
-                agent_spec.agent.persona_summary = agent_wrapper.persona_summary
-                agent_spec.agent.role_preference = agent_wrapper.role_preference
-                agent_spec.count = 1
-                simulation_input.agents.append(agent_spec)
-
-                logger.info(
-                    "Added specific agent to simulation input",
-                    structured_data={
-                        "agent_name": agent_name,
-                        "agent_id": agent_wrapper.agent_id,
-                        "context_id": simulation_input.context_id,
-                    },
+                agent_interface = mantis_core_pb2.AgentInterface(
+                    agent_id=agent_wrapper.agent_id,
+                    name=agent_wrapper.name,
+                    description=agent_wrapper.description,
+                    capabilities_summary=agent_wrapper.capabilities_summary,
+                    persona_summary=agent_wrapper.persona_summary,
+                    role_preference=agent_wrapper.role_preference,
                 )
+                simulation_input.agents.append(mantis_core_pb2.AgentSpec(agent=agent_interface, count=1))
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Added specific agent to simulation input",
+                        structured_data={
+                            "agent_name": agent_name,
+                            "agent_id": agent_interface.agent_id,
+                            "context_id": simulation_input.context_id,
+                        },
+                    )
             else:
                 logger.warning(
                     "Could not load specific agent, will use default", structured_data={"agent_name": agent_name}
@@ -262,20 +334,18 @@ Please respond as {agent_name} would, drawing on your expertise and perspective.
             parent_task_id=task_id, nested_output=nested_output, orchestrator=orchestrator, source_agent=agent_name
         )
 
-        # Extract response text for logging
-        response_text = "No response generated"
-        if nested_output.response_message and nested_output.response_message.content:
-            response_text = nested_output.response_message.content[0].text
-
-        logger.info(
-            "Successfully completed recursive agent invocation",
-            structured_data={
-                "invoking_agent": invoking_agent,
-                "target_agent": agent_name,
-                "response_length": len(response_text),
-                "artifacts_in_nested": len(nested_output.response_artifacts),
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            # Response text is only needed for its length, so read it solely when logging
+            content = nested_output.response_message.content
+            logger.info(
+                "Successfully completed recursive agent invocation",
+                structured_data={
+                    "invoking_agent": invoking_agent,
+                    "target_agent": agent_name,
+                    "response_length": len(content[0].text) if content else 0,
+                    "artifacts_in_nested": len(nested_output.response_artifacts),
+                },
+            )
 
         # Return the complete structured SimulationOutput instead of just text
         return nested_output  # type: ignore[no-any-return]
@@ -313,62 +383,90 @@ async def invoke_multiple_agents(
     Returns:
         Dictionary mapping agent names to complete SimulationOutput objects
     """
-    agent_ctx = current_agent_context.get({})
+    agent_ctx = current_agent_context.get(_EMPTY_CTX)
     invoking_agent = agent_ctx.get("agent_name", "unknown")
 
-    logger.info(
-        "Invoking multiple agents in parallel",
-        structured_data={
-            "invoking_agent": invoking_agent,
-            "target_agents": agent_names,
-            "agent_count": len(agent_names),
-        },
-    )
-
-    # Validate all agents exist
-    for agent_name in agent_names:
-        await _validate_agent_exists(agent_name)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Invoking multiple agents in parallel",
+            structured_data={
+                "invoking_agent": invoking_agent,
+                "target_agents": agent_names,
+                "agent_count": len(agent_names),
+            },
+        )
 
-    # Create parallel invocation tasks
-    tasks = []
+    # Results are keyed by agent name, so a repeated name is invoked once, in first-seen order with its first context
+    contexts: Dict[str, Optional[str]] = {}
     for i, agent_name in enumerate(agent_names):
-        context = individual_contexts[i] if individual_contexts and i < len(individual_contexts) else None
-        task = invoke_agent_by_name(
-            agent_name=agent_name, query=query_template, orchestrator=orchestrator, context=context, max_depth=max_depth
+        contexts.setdefault(
+            agent_name, individual_contexts[i] if individual_contexts and i < len(individual_contexts) else None
         )
-        tasks.append((agent_name, task))
 
-    # Execute in parallel
-    try:
-        responses = await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+    # Hardcoded A2A agents are called directly, so only the rest are validated against a single registry snapshot
+    unmapped = [agent_name for agent_name in contexts if agent_name not in _AGENT_URL_MAP]
+    if unmapped:
+        available_agents = await _fetch_available_agent_names()
+        missing = [agent_name for agent_name in unmapped if agent_name not in available_agents]
+        if missing:
+            raise ValueError(
+                f"Agents {missing} not found in registry. Available agents: {_format_available(available_agents)}"
+            )
 
-        results: Dict[str, mantis_core_pb2.SimulationOutput] = {}
-        for (agent_name, _), response in zip(tasks, responses):
-            if isinstance(response, Exception):
+    # Bound concurrency so large fan-outs don't stampede the orchestrator or agent endpoints
+    semaphore = asyncio.Semaphore(min(len(contexts), _MAX_CONCURRENT_AGENT_CALLS) or 1)
+
+    async def _invoke_one(agent_name: str, context: Optional[str]) -> mantis_core_pb2.SimulationOutput:
+        async with semaphore:
+            try:
+                response = await invoke_agent_by_name(
+                    agent_name=agent_name,
+                    query=query_template,
+                    orchestrator=orchestrator,
+                    context=context,
+                    max_depth=max_depth,
+                )
+            except Exception as e:
                 # FAIL FAST: Re-raise first agent failure instead of graceful degradation
                 logger.error(
                     f"Agent {agent_name} failed - failing entire multi-agent coordination",
-                    structured_data={"error": str(response)},
+                    structured_data={"error": str(e)},
                 )
-                raise RuntimeError(
-                    f"Multi-agent coordination failed: {agent_name} returned error: {str(response)}"
-                ) from response
-            else:
-                # Type guard: response should be SimulationOutput if not an Exception
-                assert isinstance(response, mantis_core_pb2.SimulationOutput), (
-                    f"Expected SimulationOutput, got {type(response)}"
+                raise RuntimeError(f"Multi-agent coordination failed: {agent_name} returned error: {str(e)}") from e
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Agent invocation completed", structured_data={"target_agent": agent_name})
+        return response
+
+    # Execute in parallel; the task group cancels the remaining invocations on the first failure
+    try:
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks: Dict[str, "asyncio.Task[mantis_core_pb2.SimulationOutput]"] = {}
+                for agent_name, context in contexts.items():
+                    tasks[agent_name] = task_group.create_task(_invoke_one(agent_name, context))
+        except BaseExceptionGroup as group:
+            # Surface the first agent failure itself rather than the exception group
+            for sibling in group.exceptions[1:]:
+                logger.error(
+                    "Additional agent failure during multi-agent coordination", structured_data={"error": str(sibling)}
                 )
-                results[agent_name] = response
+            first_failure = group.exceptions[0]
+            # Drop the group from the chain but keep the agent error recorded as the cause
+            raise first_failure from first_failure.__cause__
 
-        successful_count = len([r for r in results.values() if r.final_state != a2a_pb2.TASK_STATE_FAILED])
-        logger.info(
-            "Multiple agent invocation completed",
-            structured_data={
-                "invoking_agent": invoking_agent,
-                "successful_invocations": successful_count,
-                "total_agents": len(agent_names),
-            },
-        )
+        # Tasks are keyed in request order, so results keep the requested agent order
+        results = {agent_name: task.result() for agent_name, task in tasks.items()}
+
+        if logger.isEnabledFor(logging.INFO):
+            successful_count = len([r for r in results.values() if r.final_state != a2a_pb2.TASK_STATE_FAILED])
+            logger.info(
+                "Multiple agent invocation completed",
+                structured_data={
+                    "invoking_agent": invoking_agent,
+                    "successful_invocations": successful_count,
+                    "total_agents": len(tasks),
+                },
+            )
 
         return results
 
@@ -380,15 +478,64 @@ async def invoke_multiple_agents(
         raise
 
 
+def _make_simulation_output(
+    context_id: str, text: str, state: int = a2a_pb2.TASK_STATE_COMPLETED
+) -> mantis_core_pb2.SimulationOutput:
+    """Build a SimulationOutput carrying a single agent text response."""
+    return mantis_core_pb2.SimulationOutput(
+        context_id=context_id,
+        final_state=state,
+        response_message=a2a_pb2.Message(role=a2a_pb2.ROLE_AGENT, content=[a2a_pb2.Part(text=text)]),
+    )
+
+
 async def _call_agent_directly_a2a(
     agent_name: str, agent_url: str, query: str, context: Optional[str] = None
 ) -> mantis_core_pb2.SimulationOutput:
     """
     HOTFIX: Call agent directly via A2A protocol, bypassing registry complexity.
+
+    Identical concurrent calls (same agent, URL, query and context) share a single outbound
+    A2A request; each caller receives its own copy of the resulting SimulationOutput.
     """
+    key = (agent_url, agent_name, query, context)
+    call = _INFLIGHT_A2A_CALLS.get(key)
+    if call is None:
+        task = asyncio.create_task(
+            _send_a2a_request(agent_name=agent_name, agent_url=agent_url, query=query, context=context)
+        )
+        new_call = call = _INFLIGHT_A2A_CALLS[key] = _InflightA2ACall(task)
+        task.add_done_callback(lambda _: _forget_inflight_call(key, new_call))
+    else:
+        logger.info(f"🔧 HOTFIX: Joining in-flight call to {agent_name} at {agent_url}")
+
+    # The request runs in its own task so cancelling one caller doesn't cancel it for the others;
+    # it is only cancelled once every caller waiting on it has gone
+    call.waiters += 1
+    try:
+        shared = await asyncio.shield(call.task)
+    finally:
+        call.waiters -= 1
+        if call.waiters == 0 and not call.task.done():
+            _forget_inflight_call(key, call)
+            call.task.cancel()
+
+    output = mantis_core_pb2.SimulationOutput()
+    output.CopyFrom(shared)
+    return output
+
+
+def _forget_inflight_call(key: Tuple[str, str, str, Optional[str]], call: _InflightA2ACall) -> None:
+    """Drop an in-flight call so later callers start a fresh request, unless it was already replaced."""
+    if _INFLIGHT_A2A_CALLS.get(key) is call:
+        del _INFLIGHT_A2A_CALLS[key]
+
+
+async def _send_a2a_request(
+    agent_name: str, agent_url: str, query: str, context: Optional[str] = None
+) -> mantis_core_pb2.SimulationOutput:
+    """Send a message to an agent over A2A JSON-RPC and poll until the task completes."""
     import aiohttp
-    import uuid
-    import asyncio
 
     logger.info(f"🔧 HOTFIX: Calling {agent_name} directly at {agent_url}")
 
@@ -412,7 +559,7 @@ async def _call_agent_directly_a2a(
 
 Please respond as {agent_name} would, drawing on your expertise and perspective. Keep your response focused and authentic to your role."""
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(raise_for_status=True) as session:
             # Step 1: Send message/send with proper A2A typing
             message_request = {
                 "jsonrpc": "2.0",
@@ -422,82 +569,77 @@ Please respond as {agent_name} would, drawing on your expertise and perspective.
                         "role": "user",
                         "parts": [{"kind": "text", "text": full_query}],
                         "kind": "message",
-                        "messageId": str(uuid.uuid4()),
+                        "messageId": uuid.uuid4().hex,
                     },
                     "metadata": {"request_type": "direct_agent_request"},
                 },
-                "id": str(uuid.uuid4()),
+                "id": _next_rpc_id(),
             }
 
-            async with session.post(
-                agent_url,
-                json=message_request,
-                headers={"Content-Type": "application/json"},
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                if response.status != 200:
-                    raise Exception(f"Message send failed: HTTP {response.status}")
+            try:
+                async with session.post(
+                    agent_url,
+                    data=orjson.dumps(message_request),
+                    headers=_JSON_HEADERS,
+                    timeout=aiohttp.ClientTimeout(total=30),
+                ) as response:
+                    send_result = orjson.loads(await response.read())
+            except aiohttp.ClientResponseError as e:
+                raise Exception(f"Message send failed: HTTP {e.status}") from e
 
-                send_result = await response.json()
-                if "error" in send_result and send_result["error"] is not None:
-                    raise Exception(f"JSON-RPC error: {send_result['error']}")
+            if send_result.get("error") is not None:
+                raise Exception(f"JSON-RPC error: {send_result['error']}")
 
-                task_id = send_result.get("result", {}).get("id")
-                if not task_id:
-                    raise Exception(f"No task ID returned: {send_result}")
+            task_id = send_result.get("result", {}).get("id")
+            if not task_id:
+                raise Exception(f"No task ID returned: {send_result}")
 
             # Step 2: Poll for result with reasonable timeout
+            # The envelope is built once; only the JSON-RPC id changes between polls
+            tasks_request = {"jsonrpc": "2.0", "method": "tasks/get", "params": {"id": task_id}, "id": None}
+            poll_timeout = aiohttp.ClientTimeout(total=10)
             for poll_attempt in range(30):  # 60 seconds max
                 await asyncio.sleep(2)
 
-                tasks_request = {
-                    "jsonrpc": "2.0",
-                    "method": "tasks/get",
-                    "params": {"id": task_id},
-                    "id": str(uuid.uuid4()),
-                }
-
-                async with session.post(
-                    agent_url,
-                    json=tasks_request,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    if response.status != 200:
+                tasks_request["id"] = _next_rpc_id()
+
+                try:
+                    async with session.post(
+                        agent_url,
+                        data=orjson.dumps(tasks_request),
+                        headers=_JSON_HEADERS,
+                        timeout=poll_timeout,
+                    ) as response:
+                        task_result = orjson.loads(await response.read())
+                except aiohttp.ClientResponseError as e:
+                    # Server-side and throttling errors may clear up on the next poll; other 4xx never will
+                    if e.status >= 500 or e.status in _RETRYABLE_POLL_STATUSES:
                         continue
+                    raise Exception(f"Poll failed: HTTP {e.status}") from e
 
-                    task_result = await response.json()
-                    if "error" in task_result and task_result["error"] is not None:
-                        raise Exception(f"Poll error: {task_result['error']}")
+                if task_result.get("error") is not None:
+                    raise Exception(f"Poll error: {task_result['error']}")
 
-                    task_data = task_result.get("result", {})
-                    task_state = task_data.get("status", {}).get("state")
+                task_data = task_result.get("result", {})
+                task_state = task_data.get("status", {}).get("state")
 
-                    if task_state == "completed":
-                        result_text = task_data.get("result", "No response generated")
+                if task_state == "completed":
+                    result_text = task_data.get("result", "No response generated")
 
-                        # Create SimulationOutput for consistency
-                        output = mantis_core_pb2.SimulationOutput()
-                        output.context_id = f"hotfix-{agent_name.lower().replace(' ', '-')}"
-                        output.final_state = a2a_pb2.TASK_STATE_COMPLETED
-
-                        # Create response message
-                        response_msg = a2a_pb2.Message()
-                        response_msg.role = a2a_pb2.ROLE_AGENT
-                        response_part = a2a_pb2.Part()
-                        response_part.text = result_text
-                        response_msg.content.append(response_part)
-                        output.response_message.CopyFrom(response_msg)
+                    # Create SimulationOutput for consistency
+                    output = _make_simulation_output(
+                        context_id=f"hotfix-{agent_name.lower().replace(' ', '-')}", text=result_text
+                    )
 
-                        logger.info(f"✅ HOTFIX: {agent_name} responded successfully in {poll_attempt * 2} seconds")
-                        return output
+                    logger.info(f"✅ HOTFIX: {agent_name} responded successfully in {poll_attempt * 2} seconds")
+                    return output
 
-                    elif task_state == "failed":
-                        error_info = task_data.get("status", {}).get("error", "Unknown error")
-                        raise Exception(f"Task failed: {error_info}")
+                elif task_state == "failed":
+                    error_info = task_data.get("status", {}).get("error", "Unknown error")
+                    raise Exception(f"Task failed: {error_info}")
 
-                    elif task_state in ["pending", "running"]:
-                        continue
+                elif task_state in ["pending", "running"]:
+                    continue
 
             raise Exception(f"Polling timeout after 60 seconds for {agent_name}")
 
@@ -518,19 +660,18 @@ async def _validate_agent_availability(agent_url: str, agent_name: str) -> None:
 
     try:
         # Quick health check with short timeout
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5, connect=2)) as session:
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=5, connect=2), raise_for_status=True
+        ) as session:
             # Try to get agent card first
             async with session.get(f"{agent_url}/.well-known/agent.json") as response:
-                if response.status == 200:
-                    agent_card = await response.json()
-                    actual_name = agent_card.get("name", "Unknown")
-                    logger.info(
-                        f"✅ HOTFIX: Agent {agent_name} is available at {agent_url} (actual name: {actual_name})"
-                    )
-                    return
-                else:
-                    raise Exception(f"Agent card endpoint returned HTTP {response.status}")
+                agent_card = orjson.loads(await response.read())
+                actual_name = agent_card.get("name", "Unknown")
+                logger.info(f"✅ HOTFIX: Agent {agent_name} is available at {agent_url} (actual name: {actual_name})")
+                return
 
+    except aiohttp.ClientResponseError as e:
+        raise Exception(f"Health check failed: Agent card endpoint returned HTTP {e.status}")
     except asyncio.TimeoutError:
         raise Exception("Agent health check timeout after 5s")
     except aiohttp.ClientError as e:
@@ -542,35 +683,61 @@ async def _validate_agent_availability(agent_url: str, agent_name: str) -> None:
 # Removed _create_unavailable_agent_output - replaced with fail-fast behavior
 
 
-async def _validate_agent_exists(agent_name: str) -> None:
-    """Validate that agent exists in registry - fail fast if not available."""
+async def _fetch_available_agent_names() -> FrozenSet[str]:
+    """Return the set of agent names and IDs in the registry - fail fast if unavailable.
+
+    The snapshot is cached for ``_REGISTRY_CACHE_TTL`` seconds.
+    """
+    global _REG_CACHE
     from ..tools.agent_registry import list_all_agents
     from ..agent import AgentInterface
 
+    now = time.monotonic()
+    if _REG_CACHE is not None and _REG_CACHE[0] > now:
+        return _REG_CACHE[1]
+
     try:
-        # Get agents from registry - fail fast if unavailable
         all_agents = await list_all_agents()
-        if not all_agents:
-            raise RuntimeError("Registry returned no agents - agent validation failed")
+    except Exception as e:
+        raise ValueError(f"Error validating agent registry: {str(e)}")
 
-        # Check if agent exists by name or ID
-        available_agents = []
-        for agent_card in all_agents:
-            agent_interface = AgentInterface(agent_card)
-            available_agents.extend([agent_interface.agent_id, agent_interface.name])
+    if not all_agents:
+        raise ValueError("Error validating agent registry: Registry returned no agents - agent validation failed")
 
-        if agent_name not in available_agents:
-            unique_names = list(set(available_agents))[:10]
-            available_list = ", ".join(unique_names)
-            if len(unique_names) >= 10:
-                available_list += "..."
+    names = set()
+    for agent_card in all_agents:
+        agent_interface = AgentInterface(agent_card)
+        names.add(agent_interface.agent_id)
+        names.add(agent_interface.name)
 
-            raise ValueError(f"Agent '{agent_name}' not found in registry. Available agents: {available_list}")
+    available_agents = frozenset(names)
+    _REG_CACHE = (now + _REGISTRY_CACHE_TTL, available_agents)
+    return available_agents
+
+
+def _format_available(available_agents: AbstractSet[str]) -> str:
+    """Format up to ten available agent names for error messages."""
+    unique_names = list(itertools.islice(available_agents, 10))
+    available_list = ", ".join(unique_names)
+    if len(unique_names) >= 10:
+        available_list += "..."
+    return available_list
 
-    except ValueError:
-        raise  # Re-raise validation errors
-    except Exception as e:
-        raise ValueError(f"Error validating agent registry: {str(e)}")
+
+async def _validate_agent_exists(agent_name: str, available_agents: Optional[AbstractSet[str]] = None) -> None:
+    """Validate that agent exists in registry - fail fast if not available.
+
+    Args:
+        agent_name: Agent name or ID to validate
+        available_agents: Optional pre-fetched set of agent names and IDs; fetched from the registry if omitted
+    """
+    if available_agents is None:
+        available_agents = await _fetch_available_agent_names()
+
+    if agent_name not in available_agents:
+        raise ValueError(
+            f"Agent '{agent_name}' not found in registry. Available agents: {_format_available(available_agents)}"
+        )
 
 
 async def _aggregate_nested_output(
@@ -584,6 +751,14 @@ async def _aggregate_nested_output(
 
     This ensures artifacts from recursive agent calls are visible in final output.
     """
+    # Nothing to aggregate - skip the parent task lookup entirely
+    if not nested_output.response_artifacts and not any(r.response_artifacts for r in nested_output.results):
+        logger.debug(
+            "No artifacts to aggregate from nested output",
+            structured_data={"parent_task_id": parent_task_id, "source_agent": source_agent},
+        )
+        return
+
     try:
         parent_task = orchestrator.get_task_by_id(parent_task_id)
         if not parent_task:
@@ -593,39 +768,21 @@ async def _aggregate_nested_output(
             )
             return
 
-        artifacts_added = 0
-
         # Add all artifacts from nested output to parent task with proper attribution
-        for artifact in nested_output.response_artifacts:
-            # Create a copy to avoid protobuf reference issues
-            new_artifact = parent_task.artifacts.add()
-            new_artifact.CopyFrom(artifact)
-
-            # Update artifact attribution to reflect the actual generating agent
-            new_artifact.name = f"{source_agent}_response"
-            new_artifact.description = f"Response from {source_agent}"
-            artifacts_added += 1
+        artifacts = [
+            _renamed_artifact(artifact, f"{source_agent}_response", f"Response from {source_agent}")
+            for artifact in nested_output.response_artifacts
+        ]
 
         # Also add artifacts from any nested results (recursive case)
-        for nested_result in nested_output.results:
-            for artifact in nested_result.response_artifacts:
-                new_artifact = parent_task.artifacts.add()
-                new_artifact.CopyFrom(artifact)
-
-                # Try to extract the source agent from the artifact name or description
-                # The artifact name often contains the agent name
-                original_name = artifact.name
-                if "_response" in original_name:
-                    # Extract agent name from pattern "AgentName_response"
-                    extracted_agent = original_name.replace("_response", "")
-                    new_artifact.name = f"{extracted_agent}_response"
-                    new_artifact.description = f"Response from {extracted_agent}"
-                else:
-                    # Fallback: use the context or leave as-is but note it's nested
-                    new_artifact.name = f"nested_{original_name}"
-                    new_artifact.description = f"Nested response: {artifact.description}"
-
-                artifacts_added += 1
+        artifacts.extend(
+            _renamed_artifact(artifact, *_nested_artifact_names(artifact))
+            for nested_result in nested_output.results
+            for artifact in nested_result.response_artifacts
+        )
+
+        parent_task.artifacts.extend(artifacts)
+        artifacts_added = len(artifacts)
 
         if artifacts_added > 0:
             logger.info(
@@ -649,3 +806,25 @@ async def _aggregate_nested_output(
             structured_data={"parent_task_id": parent_task_id, "source_agent": source_agent, "error": str(e)},
         )
         # Don't raise - artifact aggregation failure shouldn't break execution
+
+
+def _renamed_artifact(artifact: a2a_pb2.Artifact, name: str, description: str) -> a2a_pb2.Artifact:
+    """Copy an artifact with new attribution, avoiding protobuf reference issues."""
+    new_artifact = a2a_pb2.Artifact()
+    new_artifact.CopyFrom(artifact)
+    new_artifact.name = name
+    new_artifact.description = description
+    return new_artifact
+
+
+def _nested_artifact_names(artifact: a2a_pb2.Artifact) -> Tuple[str, str]:
+    """Derive name and description for an artifact coming from a nested result."""
+    # Try to extract the source agent from the artifact name or description
+    # The artifact name often contains the agent name
+    original_name = artifact.name
+    if "_response" in original_name:
+        # Extract agent name from pattern "AgentName_response"
+        extracted_agent = original_name.replace("_response", "")
+        return f"{extracted_agent}_response", f"Response from {extracted_agent}"
+    # Fallback: use the context or leave as-is but note it's nested
+    return f"nested_{original_name}", f"Nested response: {artifact.description}"
@@ -3,14 +3,35 @@ Native pydantic-ai web fetch tool.
 Simplified to only support pydantic-ai integration.
 """
 
+import asyncio
 import logging
+from typing import List, Optional
+
 import aiohttp
 from .base import log_tool_invocation, log_tool_result
+from .http_session import SharedSession
 
 logger = logging.getLogger(__name__)
 
+_MAX_CONTENT_SIZE = 10 * 1024 * 1024  # 10MB limit
+_CHUNK_SIZE = 64 * 1024
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """Build the fetch session with a sized keep-alive pool."""
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=75)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30.0),
+        headers={"User-Agent": "Mantis-WebFetch/1.0"},
+    )
+
+
+# Shared session so repeated fetches reuse pooled keep-alive connections instead of re-handshaking
+_SESSION = SharedSession(_new_session)
 
-async def web_fetch_url(url: str) -> str:
+
+async def web_fetch_url(url: str, max_bytes: Optional[int] = None) -> str:
     """Fetch content from a web URL.
 
     This tool fetches content from web pages and returns information about
@@ -18,47 +39,75 @@ async def web_fetch_url(url: str) -> str:
 
     Args:
         url: URL to fetch content from
+        max_bytes: Stop reading the body after this many bytes (default: the 10MB limit)
 
     Returns:
         Success message with content length or error message
     """
+    if max_bytes is not None and max_bytes < 1:
+        return f"Error fetching URL {url}: max_bytes must be at least 1"
+
     log_tool_invocation("web_fetch", "web_fetch_url", {"url": url})
+    limit = _MAX_CONTENT_SIZE if max_bytes is None else min(max_bytes, _MAX_CONTENT_SIZE)
 
     try:
-        # Create secure session with proper settings
-        timeout = aiohttp.ClientTimeout(total=30.0)
-        headers = {"User-Agent": "Mantis-WebFetch/1.0"}
-
-        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-            async with session.get(url, ssl=True) as response:
-                # Read content with size limit
-                content = await response.read()
-                max_size = 10 * 1024 * 1024  # 10MB limit
-
-                if len(content) > max_size:
-                    content = content[:max_size]
-
-                content_text = content.decode("utf-8", errors="ignore")
-
-                if response.status == 200:
-                    log_tool_result(
-                        "web_fetch",
-                        "web_fetch_url",
-                        {
-                            "url": url,
-                            "status_code": response.status,
-                            "content_length": len(content_text),
-                            "success": True,
-                        },
-                    )
-                    return content_text  # Return actual content for LLM/testing
-                else:
-                    error_msg = f"Failed to fetch URL {url}: HTTP {response.status}"
-                    log_tool_result(
-                        "web_fetch", "web_fetch_url", {"url": url, "status_code": response.status, "success": False}
-                    )
-                    return error_msg
+        session = await _SESSION.get()
+        async with session.get(url, ssl=True) as response:
+            if response.status != 200:
+                error_msg = f"Failed to fetch URL {url}: HTTP {response.status}"
+                log_tool_result(
+                    "web_fetch", "web_fetch_url", {"url": url, "status_code": response.status, "success": False}
+                )
+                return error_msg
+
+            # Stream content and stop at the size limit instead of buffering oversized bodies
+            content = bytearray()
+            async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                content.extend(chunk)
+                if len(content) >= limit:
+                    del content[limit:]
+                    break
+
+            # Honor the server's declared charset; unknown charsets fall back to UTF-8
+            try:
+                content_text = content.decode(response.charset or "utf-8", errors="replace")
+            except LookupError:
+                content_text = content.decode("utf-8", errors="replace")
+
+            log_tool_result(
+                "web_fetch",
+                "web_fetch_url",
+                {
+                    "url": url,
+                    "status_code": response.status,
+                    "content_length": len(content_text),
+                    "success": True,
+                },
+            )
+            return content_text  # Return actual content for LLM/testing
 
     except Exception as e:
         error_msg = f"Error fetching URL {url}: {str(e)}"
         return error_msg
+
+
+async def web_fetch_urls(urls: List[str], concurrency: int = 10) -> List[str]:
+    """Fetch content from several web URLs concurrently.
+
+    Args:
+        urls: URLs to fetch content from
+        concurrency: Maximum number of fetches in flight at once (default: 10)
+
+    Returns:
+        Content or error message for each URL, in the same order as ``urls``
+    """
+    if concurrency < 1:
+        return [f"Error fetching URL {url}: concurrency must be at least 1" for url in urls]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch_one(url: str) -> str:
+        async with semaphore:
+            return await web_fetch_url(url)
+
+    return list(await asyncio.gather(*(_fetch_one(url) for url in urls)))
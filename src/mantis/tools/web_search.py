@@ -3,17 +3,31 @@ Native pydantic-ai web search tool using DuckDuckGo.
 Simplified to only support pydantic-ai integration.
 """
 
+import asyncio
 import logging
+from typing import Any, Dict, List, Tuple
 
 try:
     from duckduckgo_search import DDGS  # type: ignore[assignment,import-untyped]
 except ImportError:
     from ddgs import DDGS  # type: ignore[assignment,import-untyped,import-not-found,no-redef]
 from .base import log_tool_invocation, log_tool_result
+from .cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
+# DuckDuckGo rate-limits aggressively, so repeated searches are answered from a small LRU:
+# (normalized query, max_results) -> results
+_SEARCH_CACHE: TTLCache[Tuple[str, int], List[Dict[str, Any]]] = TTLCache(ttl=300.0, max_entries=512)
+
+
+def _ddgs_text(query: str, max_results: int) -> List[Dict[str, Any]]:
+    """Run a blocking DuckDuckGo text search."""
+    with DDGS() as ddgs:
+        return list(ddgs.text(query, max_results=max_results))
+
+
 async def web_search(query: str, max_results: int = 10) -> str:
     """Search the web using DuckDuckGo for information.
 
@@ -30,24 +44,28 @@ async def web_search(query: str, max_results: int = 10) -> str:
     log_tool_invocation("web_search", "web_search", {"query": query, "max_results": max_results})
 
     try:
-        # Use DuckDuckGo search
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=max_results))
-
-            if not results:
-                log_tool_result("web_search", "web_search", {"results_count": 0, "query": query})
-                return f"No results found for query: '{query}'"
+        cache_key = (" ".join(query.lower().split()), max_results)
+        results = _SEARCH_CACHE.get(cache_key)
+        if results is None:
+            # DDGS is synchronous; run it in a worker thread so the search doesn't block the event loop
+            results = await asyncio.to_thread(_ddgs_text, query, max_results)
+            # Empty results are often transient (rate limiting, backend hiccups), so only hits are cached
+            if results:
+                _SEARCH_CACHE.set(cache_key, results)
 
-            # Format results for LLM
-            formatted_results = []
-            for i, result in enumerate(results, 1):
-                formatted_results.append(f"{i}. **{result['title']}**\n   {result['href']}\n   {result['body']}")
+        if not results:
+            log_tool_result("web_search", "web_search", {"results_count": 0, "query": query})
+            return f"No results found for query: '{query}'"
 
-            result_text = f"Found {len(results)} results for '{query}':\n\n" + "\n\n".join(formatted_results)
+        # Format results for LLM
+        result_text = f"Found {len(results)} results for '{query}':\n\n" + "\n\n".join(
+            f"{i}. **{result['title']}**\n   {result['href']}\n   {result['body']}"
+            for i, result in enumerate(results, 1)
+        )
 
-            log_tool_result("web_search", "web_search", {"results_count": len(results), "query": query})
+        log_tool_result("web_search", "web_search", {"results_count": len(results), "query": query})
 
-            return result_text
+        return result_text
 
     except Exception as e:
         error_msg = f"Error searching for '{query}': {str(e)}"
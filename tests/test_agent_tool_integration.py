@@ -7,9 +7,9 @@ to distinguish between mocked and live integration tests.
 """
 
 import os
+import re
 import pytest
-from unittest.mock import AsyncMock, patch
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 # Load environment variables from .env file
 try:
@@ -18,11 +18,9 @@ try:
 except ImportError:
     pass  # dotenv not available, skip
 
-# Import pydantic-ai components
+# Import pydantic-ai components (model providers resolve lazily from the model string)
 try:
     from pydantic_ai import Agent, RunContext
-    from pydantic_ai.models.anthropic import AnthropicModel
-    from pydantic_ai.models.openai import OpenAIModel
     PYDANTIC_AI_AVAILABLE = True
 except ImportError:
     PYDANTIC_AI_AVAILABLE = False
@@ -39,11 +37,21 @@ live_integration = pytest.mark.live_integration
 mocked_integration = pytest.mark.mocked_integration
 multi_tool_workflow = pytest.mark.multi_tool_workflow
 
+# Case-insensitive success indicators, compiled once so each check is a single scan of the LLM output
+_WEBFETCH_INDICATORS = re.compile(r"json|data|structure|object", re.IGNORECASE)
+_WEBSEARCH_INDICATORS = re.compile(r"pydantic|tutorial|found|resource", re.IGNORECASE)
+_GIT_INDICATORS = re.compile(r"repository|hello|world|branch", re.IGNORECASE)
+_MULTI_TOOL_INDICATORS = re.compile(r"json|httpbin|search|fetch|found", re.IGNORECASE)
+_EXECUTOR_INDICATORS = re.compile(r"json|data|structure|httpbin|fetch", re.IGNORECASE)
+
+# Cap fetched pages handed back to the LLM; the agents only need enough to summarize the structure
+_TOOL_FETCH_MAX_BYTES = 8 * 1024
+
 
 class TestAgentWebFetchToolIntegration:
     """Test pydantic-ai agents using WebFetchTool."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def web_fetch_agent(self):
         """Create an agent with WebFetchTool capability."""
         # Check API key before creating agent
@@ -64,7 +72,7 @@ class TestAgentWebFetchToolIntegration:
         async def web_fetch(ctx: RunContext[Dict[str, Any]], url: str, method: str = "GET") -> str:
             """Fetch content from a web URL."""
             if method.upper() == "GET":
-                return await web_fetch_url(url)
+                return await web_fetch_url(url, max_bytes=_TOOL_FETCH_MAX_BYTES)
             else:
                 return f"Method {method} not supported in test"
         
@@ -96,14 +104,13 @@ class TestAgentWebFetchToolIntegration:
         assert result.output is not None
         assert len(result.output) > 50  # Should have substantial response
         # The agent should mention JSON structure since httpbin.org/json returns JSON
-        response_lower = result.output.lower()
-        assert any(word in response_lower for word in ["json", "data", "structure", "object"])
+        assert _WEBFETCH_INDICATORS.search(result.output)
 
 
 class TestAgentWebSearchToolIntegration:
     """Test pydantic-ai agents using WebSearchTool."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def web_search_agent(self):
         """Create an agent with WebSearchTool capability."""
         # Check API key before creating agent
@@ -152,14 +159,13 @@ class TestAgentWebSearchToolIntegration:
         # Verify the agent successfully used the tool and processed results
         assert result.output is not None
         assert len(result.output) > 100  # Should have substantial response
-        response_lower = result.output.lower()
-        assert any(word in response_lower for word in ["pydantic", "tutorial", "found", "resource"])
+        assert _WEBSEARCH_INDICATORS.search(result.output)
 
 
 class TestAgentGitOperationsToolIntegration:
     """Test pydantic-ai agents using GitOperationsTool."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def git_agent(self):
         """Create an agent with GitOperationsTool capability."""
         # Check API key before creating agent
@@ -208,15 +214,14 @@ class TestAgentGitOperationsToolIntegration:
         # Verify the agent successfully used the tool
         assert result.output is not None
         assert len(result.output) > 50  # Should have substantial response
-        response_lower = result.output.lower()
-        assert any(word in response_lower for word in ["repository", "hello", "world", "branch"])
+        assert _GIT_INDICATORS.search(result.output)
 
 
 @multi_tool_workflow
 class TestMultiToolWorkflows:
     """Test agents using multiple tools in complex workflows."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def multi_tool_agent(self):
         """Create an agent with multiple tool capabilities."""
         # Check API key before creating agent
@@ -241,7 +246,7 @@ class TestMultiToolWorkflows:
         @agent.tool
         async def web_fetch(ctx: RunContext[Dict[str, Any]], url: str) -> str:
             """Fetch content from a web URL."""
-            return await web_fetch_url(url)
+            return await web_fetch_url(url, max_bytes=_TOOL_FETCH_MAX_BYTES)
         
         return agent
 
@@ -270,8 +275,7 @@ class TestMultiToolWorkflows:
         # Verify the agent used tools and provided meaningful results
         assert result.output is not None
         assert len(result.output) > 100  # Should have substantial response
-        response_lower = result.output.lower()
-        assert any(word in response_lower for word in ["json", "httpbin", "search", "fetch", "found"])
+        assert _MULTI_TOOL_INDICATORS.search(result.output)
 
 
 class TestDirectExecutorRealLLMIntegration:
@@ -313,10 +317,9 @@ class TestDirectExecutorRealLLMIntegration:
         response_text = response.response_message.content[0].text
         assert response_text is not None
         assert len(response_text) > 100  # Should have substantial response
-        response_lower = response_text.lower()
         
         # The response should indicate the agent tried to use tools or understood the request
-        assert any(word in response_lower for word in ["json", "data", "structure", "httpbin", "fetch"])
+        assert _EXECUTOR_INDICATORS.search(response_text)
 
     @pytest.mark.asyncio
     async def test_direct_executor_tool_availability(self):
@@ -0,0 +1,57 @@
+"""
+Unit tests for the shared tool caches.
+"""
+
+from unittest.mock import patch
+
+from mantis.tools import cache
+from mantis.tools.cache import TTLCache, credential_digest
+
+
+class TestTTLCache:
+    """Test expiry, LRU eviction and sweeping."""
+
+    def test_get_returns_stored_value_until_expiry(self):
+        """Test that entries are served until their TTL has passed."""
+        ttl_cache: TTLCache[str, int] = TTLCache(ttl=10.0, max_entries=4)
+
+        with patch.object(cache.time, "monotonic", return_value=100.0):
+            ttl_cache.set("a", 1)
+            assert ttl_cache.get("a") == 1
+        with patch.object(cache.time, "monotonic", return_value=110.0):
+            assert ttl_cache.get("a") is None
+
+        assert len(ttl_cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that a read refreshes recency so the other entry is evicted when full."""
+        ttl_cache: TTLCache[str, int] = TTLCache(ttl=10.0, max_entries=2)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.get("a")
+
+        ttl_cache.set("c", 3)
+
+        assert list(ttl_cache) == ["a", "c"]
+
+    def test_set_sweeps_expired_entries(self):
+        """Test that storing an entry drops expired entries that were never read again."""
+        ttl_cache: TTLCache[str, int] = TTLCache(ttl=10.0, max_entries=8)
+        with patch.object(cache.time, "monotonic", return_value=100.0):
+            ttl_cache.set("stale", 0)
+        with patch.object(cache.time, "monotonic", return_value=105.0):
+            ttl_cache.set("fresh", 1)
+
+        with patch.object(cache.time, "monotonic", return_value=112.0):
+            ttl_cache.set("new", 2)
+
+        assert list(ttl_cache) == ["fresh", "new"]
+
+
+def test_credential_digest_hides_the_secret():
+    """Test that digests are stable, distinct per secret and don't contain the secret."""
+    digest = credential_digest("secret-token")
+
+    assert digest == credential_digest("secret-token")
+    assert digest != credential_digest("other-token")
+    assert "secret-token" not in digest
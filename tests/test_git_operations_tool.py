@@ -0,0 +1,108 @@
+"""
+Unit tests for git_analyze_repository without network access.
+"""
+
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mantis.tools import git_operations
+
+
+def _fake_run(cmd, *args, **kwargs):
+    """Stand in for git/du: the clone creates an empty checkout, everything else succeeds."""
+    if cmd[:2] == ["git", "clone"]:
+        git_dir = Path(cmd[-1]) / ".git"
+        git_dir.mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/master")
+        (Path(cmd[-1]) / "README").write_text("Hello World!")
+        (Path(cmd[-1]) / ".gitignore").write_text("*.pyc")
+    stdout = "4.0K\t." if cmd[0] == "du" else "master"
+    return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+
+@pytest.fixture(autouse=True)
+def clear_analysis_cache():
+    """Reset the analysis cache between tests."""
+    git_operations._ANALYSIS_CACHE.clear()
+    yield
+    git_operations._ANALYSIS_CACHE.clear()
+
+
+class TestGitAnalyzeRepository:
+    """Test git_analyze_repository caching and validation."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_analysis_reuses_clone(self):
+        """Test that equivalent repository URLs are only cloned once."""
+        with patch.object(git_operations.subprocess, "run", side_effect=_fake_run) as mock_run:
+            first = await git_operations.git_analyze_repository("https://github.com/octocat/Hello-World.git")
+            second = await git_operations.git_analyze_repository("HTTPS://GitHub.com/octocat/Hello-World")
+
+        clone_calls = [call for call in mock_run.call_args_list if call.args[0][:2] == ["git", "clone"]]
+        assert len(clone_calls) == 1
+        assert "**Repository: Hello-World**" in first
+        # Matches the original rglob count: .git/HEAD is included, .gitignore is not
+        assert "Files: 2" in first
+        assert second == first.replace(
+            "URL: https://github.com/octocat/Hello-World.git", "URL: HTTPS://GitHub.com/octocat/Hello-World"
+        )
+
+    @pytest.mark.asyncio
+    async def test_path_case_is_not_normalized(self):
+        """Test that repositories differing only in path case are analyzed separately."""
+        with patch.object(git_operations.subprocess, "run", side_effect=_fake_run) as mock_run:
+            first = await git_operations.git_analyze_repository("https://github.com/octocat/Hello-World")
+            second = await git_operations.git_analyze_repository("https://github.com/octocat/hello-world")
+
+        clone_calls = [call for call in mock_run.call_args_list if call.args[0][:2] == ["git", "clone"]]
+        assert len(clone_calls) == 2
+        assert "URL: https://github.com/octocat/Hello-World" in first
+        assert "URL: https://github.com/octocat/hello-world" in second
+
+    @pytest.mark.asyncio
+    async def test_clone_failure_is_not_cached(self):
+        """Test that failed clones are retried on the next call."""
+        failure = subprocess.CompletedProcess([], 128, stdout="", stderr="not found")
+
+        with patch.object(git_operations.subprocess, "run", return_value=failure) as mock_run:
+            result = await git_operations.git_analyze_repository("https://github.com/octocat/missing.git")
+            await git_operations.git_analyze_repository("https://github.com/octocat/missing.git")
+
+        assert result == "Error cloning repository: not found"
+        assert mock_run.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_https_rejected(self):
+        """Test that non-HTTPS repository URLs are rejected before cloning."""
+        with patch.object(git_operations.subprocess, "run") as mock_run:
+            result = await git_operations.git_analyze_repository("git://github.com/octocat/Hello-World.git")
+
+        assert result == "Error: Only HTTPS repositories are allowed, got git"
+        mock_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_clone_uses_configured_scratch_dir(self, tmp_path, monkeypatch):
+        """Test that clones are checked out under MANTIS_GIT_SCRATCH_DIR when set."""
+        monkeypatch.setenv("MANTIS_GIT_SCRATCH_DIR", str(tmp_path))
+
+        with patch.object(git_operations.subprocess, "run", side_effect=_fake_run) as mock_run:
+            await git_operations.git_analyze_repository("https://github.com/octocat/Hello-World.git")
+
+        clone_path = Path(mock_run.call_args_list[0].args[0][-1])
+        assert clone_path.parent.parent == tmp_path
+        assert not clone_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_clone_defaults_to_system_temp_dir(self, monkeypatch):
+        """Test that clones use the system temp dir unless a scratch dir is configured."""
+        monkeypatch.delenv("MANTIS_GIT_SCRATCH_DIR", raising=False)
+
+        with patch.object(git_operations.subprocess, "run", side_effect=_fake_run) as mock_run:
+            await git_operations.git_analyze_repository("https://github.com/octocat/Hello-World.git")
+
+        clone_path = Path(mock_run.call_args_list[0].args[0][-1])
+        assert clone_path.parent.parent == Path(tempfile.gettempdir())
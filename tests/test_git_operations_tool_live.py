@@ -5,10 +5,18 @@ Tests against real repositories - fail fast if they don't work.
 
 import pytest
 import os
+import re
 
 from mantis.tools.git_operations import git_analyze_repository
 
 
+@pytest.fixture(autouse=True)
+def tmpfs_scratch_dir(monkeypatch):
+    """Check live clones out on tmpfs when the host has one, to keep the tests off disk."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        monkeypatch.setenv("MANTIS_GIT_SCRATCH_DIR", "/dev/shm")
+
+
 class TestGitOperationsToolLive:
     """Live integration tests for git_analyze_repository function."""
 
@@ -21,9 +29,8 @@ class TestGitOperationsToolLive:
         
         result = await git_analyze_repository(repo_url)
         
-        assert "error" not in result.lower()
-        assert "failed" not in result.lower()
-        assert "hello-world" in result.lower()
+        assert not re.search("error|failed", result, re.IGNORECASE)
+        assert re.search("hello-world", result, re.IGNORECASE)
         assert len(result) > 50  # Should have substantial analysis
 
     @pytest.mark.skipif(not os.getenv('ANTHROPIC_API_KEY'), reason="ANTHROPIC_API_KEY not set")
@@ -33,4 +40,4 @@ class TestGitOperationsToolLive:
         result = await git_analyze_repository("https://github.com/this-repo-should-not-exist-12345/test.git")
         
         # Should return error message
-        assert ("error" in result.lower() or "failed" in result.lower() or "not found" in result.lower())
\ No newline at end of file
+        assert re.search("error|failed|not found", result, re.IGNORECASE)
\ No newline at end of file
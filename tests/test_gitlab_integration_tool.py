@@ -0,0 +1,84 @@
+"""
+Unit tests for the GitLab tools against a local aiohttp server.
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mantis.tools import gitlab_integration
+from mantis.tools.gitlab_integration import gitlab_list_projects
+
+
+@pytest_asyncio.fixture
+async def gitlab_server():
+    """Serve a minimal GitLab projects API that counts requests."""
+    app = web.Application()
+    hits = []
+
+    async def projects(request):
+        hits.append(request.path_qs)
+        if request.query.get("search") == "nothing":
+            return web.json_response([])
+        return web.json_response(
+            [{"name": "mantis", "description": "Agents", "web_url": "https://gitlab.example/mantis", "namespace": {}}]
+        )
+
+    app.router.add_get("/api/v4/projects", projects)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.hits = hits
+    gitlab_integration._PROJECTS_CACHE.clear()
+    yield server
+    gitlab_integration._PROJECTS_CACHE.clear()
+    await server.close()
+    await gitlab_integration._SESSION.close()
+
+
+class TestGitLabListProjects:
+    """Test gitlab_list_projects formatting and memoization."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_listing_is_memoized(self, gitlab_server):
+        """Test that an identical listing is served from cache."""
+        base_url = str(gitlab_server.make_url(""))
+
+        first = await gitlab_list_projects(base_url, "token")
+        second = await gitlab_list_projects(base_url, "token")
+
+        assert first == second
+        assert "- **mantis** (): Agents" in first
+        assert len(gitlab_server.hits) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_search_is_not_shared(self, gitlab_server):
+        """Test that listings with different filters or tokens are fetched separately."""
+        base_url = str(gitlab_server.make_url(""))
+
+        await gitlab_list_projects(base_url, "token")
+        await gitlab_list_projects(base_url, "token", search="mantis")
+        await gitlab_list_projects(base_url, "other-token")
+
+        assert len(gitlab_server.hits) == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_key_does_not_hold_raw_token(self, gitlab_server):
+        """Test that cached listings are keyed by a token digest, not the token itself."""
+        await gitlab_list_projects(str(gitlab_server.make_url("")), "secret-token")
+
+        (cache_key,) = gitlab_integration._PROJECTS_CACHE
+        assert "secret-token" not in cache_key
+
+    @pytest.mark.asyncio
+    async def test_empty_listing_is_not_cached(self, gitlab_server):
+        """Test that a listing with no projects is fetched again on the next call."""
+        base_url = str(gitlab_server.make_url(""))
+
+        first = await gitlab_list_projects(base_url, "token", search="nothing")
+        await gitlab_list_projects(base_url, "token", search="nothing")
+
+        assert first == "No GitLab projects found matching 'nothing'"
+        assert len(gitlab_server.hits) == 2
+        assert not gitlab_integration._PROJECTS_CACHE
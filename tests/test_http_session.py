@@ -0,0 +1,67 @@
+"""
+Unit tests for the shared tool HTTP sessions.
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from mantis.tools import http_session
+from mantis.tools.http_session import SharedSession, close_all_sessions
+
+
+@pytest.fixture
+def shared():
+    """A SharedSession that is unregistered again after the test."""
+    session = SharedSession(aiohttp.ClientSession)
+    yield session
+    http_session._SHARED_SESSIONS.remove(session)
+
+
+class TestSharedSession:
+    """Test session reuse, loop changes and shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_within_a_loop(self, shared):
+        """Test that concurrent callers on one loop share a single session."""
+        first, second = await asyncio.gather(shared.get(), shared.get())
+
+        assert first is second
+        await shared.close()
+        assert first.closed
+
+    def test_loop_change_closes_stale_session(self, shared):
+        """Test that moving to a new event loop closes the session from the old one."""
+        first = asyncio.run(shared.get())
+
+        async def second_loop():
+            session = await shared.get()
+            await close_all_sessions()
+            return session
+
+        second = asyncio.run(second_loop())
+
+        assert first is not second
+        assert first.closed
+        assert second.closed
+
+    @pytest.mark.asyncio
+    async def test_close_all_sessions_closes_registered_sessions(self, shared):
+        """Test the shutdown hook closes every shared session and allows re-creation."""
+        session = await shared.get()
+
+        await close_all_sessions()
+
+        assert session.closed
+        replacement = await shared.get()
+        assert replacement is not session and not replacement.closed
+        await shared.close()
+
+    def test_run_async_closes_sessions_on_exit(self, shared):
+        """Test that the CLI runner closes shared sessions before its loop shuts down."""
+        from mantis.cli.core import run_async
+
+        session = run_async(shared.get())
+
+        assert session.closed
@@ -0,0 +1,94 @@
+"""
+Unit tests for the Jira tools against a local aiohttp server.
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mantis.tools import jira_integration
+from mantis.tools.jira_integration import jira_get_issue, jira_list_projects
+
+
+@pytest_asyncio.fixture
+async def jira_server():
+    """Serve a minimal Jira project API that counts requests."""
+    app = web.Application()
+    hits = []
+
+    async def projects(request):
+        hits.append(request.path_qs)
+        return web.json_response(
+            [
+                {"key": "DEV", "name": "Development", "description": "Dev work"},
+                {"key": "OPS", "name": "Operations", "description": "Ops work"},
+            ]
+        )
+
+    async def issue(request):
+        comments = [
+            {
+                "author": {"displayName": f"User {i}"},
+                "body": "x" * 250 if i == 6 else f"note {i}",
+                "created": f"2024-01-0{i}T10:00",
+            }
+            for i in range(1, 7)
+        ]
+        return web.json_response({"key": "DEV-1", "fields": {"summary": "Bug", "comment": {"comments": comments}}})
+
+    app.router.add_get("/rest/api/2/project", projects)
+    app.router.add_get("/rest/api/2/issue/DEV-1", issue)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.hits = hits
+    jira_integration._PROJECTS_CACHE.clear()
+    yield server
+    jira_integration._PROJECTS_CACHE.clear()
+    await server.close()
+    await jira_integration._SESSION.close()
+
+
+class TestJiraListProjects:
+    """Test jira_list_projects filtering and memoization."""
+
+    @pytest.mark.asyncio
+    async def test_key_filters_share_cached_listing(self, jira_server):
+        """Test that different key filters reuse one cached project listing."""
+        base_url = str(jira_server.make_url(""))
+
+        all_projects = await jira_list_projects(base_url, "user", "token")
+        dev_only = await jira_list_projects(base_url, "user", "token", project_key="dev")
+
+        assert all_projects.startswith("Found 2 Jira projects:")
+        assert dev_only.startswith("Found 1 Jira projects:")
+        assert "**DEV: Development**" in dev_only
+        assert "OPS" not in dev_only
+        assert len(jira_server.hits) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_key_reports_no_projects(self, jira_server):
+        """Test the message when the key filter matches nothing."""
+        result = await jira_list_projects(str(jira_server.make_url("")), "user", "token", project_key="NOPE")
+
+        assert result == "No Jira projects found with key 'NOPE'"
+
+
+class TestJiraGetIssue:
+    """Test jira_get_issue formatting."""
+
+    @pytest.mark.asyncio
+    async def test_last_five_comments_are_listed(self, jira_server):
+        """Test that only the five most recent comments are shown, with long bodies truncated."""
+        result = await jira_get_issue(str(jira_server.make_url("")), "user", "token", "DEV-1")
+
+        assert "**Jira Issue DEV-1: Bug**" in result
+        assert result.endswith(
+            "\n\n**Comments (6):**\n"
+            "\n- **User 2** (2024-01-02): note 2"
+            "\n- **User 3** (2024-01-03): note 3"
+            "\n- **User 4** (2024-01-04): note 4"
+            "\n- **User 5** (2024-01-05): note 5"
+            f"\n- **User 6** (2024-01-06): {'x' * 200}..."
+        )
@@ -349,6 +349,82 @@ class TestMantisService:
             assert health["available_tools"] == 3
             assert "timestamp" in health
 
+    @pytest.mark.asyncio
+    async def test_team_members_execute_concurrently_in_order(self):
+        """Test team members run concurrently and responses keep member order."""
+        team_request = mantis_core_pb2.TeamExecutionRequest()
+        team_request.simulation_input.context_id = "team-context"
+        team_request.simulation_input.query = "team query"
+        team_request.team_size = 3
+
+        members = [Mock(name=f"member-{i}") for i in range(3)]
+        for i, member in enumerate(members):
+            member.name = f"Agent {i}"
+        delays = [0.03, 0.0, 0.01]
+        running = 0
+        max_running = 0
+
+        async def fake_process(simulation_input, agent_interface):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(delays[members.index(agent_interface)])
+            running -= 1
+            output = mantis_core_pb2.SimulationOutput()
+            output.final_state = a2a_pb2.TASK_STATE_COMPLETED
+            output.response_message.message_id = agent_interface.name
+            return output
+
+        with patch('mantis.core.mantis_service.TeamFactory') as mock_team_factory:
+            mock_team = AsyncMock()
+            mock_team.select_team_members.return_value = members
+            mock_team_factory.return_value.create_team.return_value = mock_team
+
+            with patch.object(self.service, 'process_simulation_input', side_effect=fake_process):
+                result = await self.service.process_team_execution_request(team_request)
+
+        assert max_running == 3
+        assert [m.message_id for m in result.member_messages] == ["Agent 0", "Agent 1", "Agent 2"]
+        assert result.team_final_state == a2a_pb2.TASK_STATE_COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_team_member_failure_cancels_other_members(self):
+        """Test one failing member cancels the rest and surfaces a RuntimeError."""
+        team_request = mantis_core_pb2.TeamExecutionRequest()
+        team_request.simulation_input.context_id = "team-context"
+        team_request.simulation_input.query = "team query"
+        team_request.team_size = 3
+
+        members = [Mock(name=f"member-{i}") for i in range(3)]
+        for i, member in enumerate(members):
+            member.name = f"Agent {i}"
+        cancelled = []
+
+        async def fake_process(simulation_input, agent_interface):
+            if agent_interface.name == "Agent 1":
+                raise ValueError("member down")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(agent_interface.name)
+                raise
+
+        with patch('mantis.core.mantis_service.TeamFactory') as mock_team_factory:
+            mock_team = AsyncMock()
+            mock_team.select_team_members.return_value = members
+            mock_team_factory.return_value.create_team.return_value = mock_team
+
+            with patch.object(self.service, 'process_simulation_input', side_effect=fake_process):
+                with pytest.raises(RuntimeError) as exc_info:
+                    await self.service.process_team_execution_request(team_request)
+
+        assert sorted(cancelled) == ["Agent 0", "Agent 2"]
+        assert str(exc_info.value) == "Team execution failed: Team member execution failed for Agent 1: member down"
+        member_failure = exc_info.value.__cause__
+        assert isinstance(member_failure, RuntimeError)
+        assert member_failure.__suppress_context__
+        assert isinstance(member_failure.__cause__, ValueError)
+
 
 class TestMantisServiceA2AIntegration:
     """Test suite specifically for A2A protocol integration."""
@@ -272,5 +272,53 @@ class TestProtobufFieldValidation:
         assert sim_output.response_message.message_id == "nested-msg"
 
 
+class TestAgentCardJsonConversion:
+    """Test JSON to protobuf AgentCard conversion."""
+
+    def test_camel_case_and_unknown_capability_fields(self):
+        """Test that camelCase JSON names parse and fields outside the spec are ignored."""
+        from mantis.agent.card import json_to_protobuf_agent_card
+
+        card = json_to_protobuf_agent_card(
+            {
+                "name": "Test Agent",
+                "capabilities": {"pushNotifications": True, "stateTransitionHistory": True, "streaming": True},
+            }
+        )
+
+        assert card.name == "Test Agent"
+        assert card.capabilities.push_notifications is True
+        assert card.capabilities.streaming is True
+
+    def test_nested_struct_keys_are_kept_as_is(self):
+        """Test that keys inside extension params Structs are not renamed or dropped."""
+        from google.protobuf.json_format import MessageToDict
+
+        from mantis.agent.card import json_to_protobuf_agent_card
+
+        card = json_to_protobuf_agent_card(
+            {
+                "name": "Test Agent",
+                "capabilities": {
+                    "extensions": [
+                        {
+                            "uri": "https://example.com/ext/persona",
+                            "params": {
+                                "pushNotifications": "on",
+                                "nested": {"stateTransitionHistory": True, "snake_key": [{"innerKey": 1}]},
+                            },
+                        }
+                    ]
+                },
+            }
+        )
+
+        (extension,) = card.capabilities.extensions
+        assert MessageToDict(extension.params) == {
+            "pushNotifications": "on",
+            "nested": {"stateTransitionHistory": True, "snake_key": [{"innerKey": 1}]},
+        }
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,367 @@
+"""
+Tests for recursive agent invocation helpers.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mantis.proto.mantis.v1.mantis_persona_pb2 import MantisAgentCard
+from mantis.tools import recursive_invocation
+
+
+def _make_card(name: str) -> MantisAgentCard:
+    card = MantisAgentCard()
+    card.agent_card.name = name
+    return card
+
+
+@pytest.fixture(autouse=True)
+def clear_registry_cache():
+    """Reset the cached registry snapshot between tests."""
+    recursive_invocation._REG_CACHE = None
+    yield
+    recursive_invocation._REG_CACHE = None
+
+
+class TestAgentValidation:
+    """Test registry validation used by recursive invocation."""
+
+    @pytest.mark.asyncio
+    async def test_invoke_multiple_agents_fetches_registry_once(self):
+        """Test that validating several agents uses a single registry snapshot."""
+        cards = [_make_card("Ada Lovelace"), _make_card("Alan Turing")]
+
+        with patch("mantis.tools.agent_registry.list_all_agents", new=AsyncMock(return_value=cards)) as mock_list:
+            with patch.object(recursive_invocation, "invoke_agent_by_name", new=AsyncMock()) as mock_invoke:
+                mock_invoke.return_value = recursive_invocation.mantis_core_pb2.SimulationOutput()
+
+                results = await recursive_invocation.invoke_multiple_agents(
+                    ["Ada Lovelace", "Alan Turing"], "query", orchestrator=MagicMock()
+                )
+
+        assert mock_list.await_count == 1
+        assert set(results) == {"Ada Lovelace", "Alan Turing"}
+
+    @pytest.mark.asyncio
+    async def test_invoke_multiple_agents_skips_registry_for_hardcoded_agents(self):
+        """Test that hardcoded A2A agents don't need to be listed in the registry."""
+        with patch("mantis.tools.agent_registry.list_all_agents", new=AsyncMock(return_value=[])) as mock_list:
+            with patch.object(recursive_invocation, "invoke_agent_by_name", new=AsyncMock()) as mock_invoke:
+                mock_invoke.return_value = recursive_invocation.mantis_core_pb2.SimulationOutput()
+
+                results = await recursive_invocation.invoke_multiple_agents(
+                    ["Steve Jobs", "Peter Drucker"], "query", orchestrator=MagicMock()
+                )
+
+        mock_list.assert_not_called()
+        assert set(results) == {"Steve Jobs", "Peter Drucker"}
+
+    @pytest.mark.asyncio
+    async def test_invoke_multiple_agents_reports_missing_agents(self):
+        """Test that unknown agents fail fast before any invocation."""
+        cards = [_make_card("Steve Jobs")]
+
+        with patch("mantis.tools.agent_registry.list_all_agents", new=AsyncMock(return_value=cards)):
+            with patch.object(recursive_invocation, "invoke_agent_by_name", new=AsyncMock()) as mock_invoke:
+                with pytest.raises(ValueError) as exc_info:
+                    await recursive_invocation.invoke_multiple_agents(
+                        ["Steve Jobs", "Nobody"], "query", orchestrator=MagicMock()
+                    )
+
+        assert "Nobody" in str(exc_info.value)
+        mock_invoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_validate_agent_exists_uses_prefetched_names(self):
+        """Test that a pre-fetched name set skips the registry."""
+        with patch("mantis.tools.agent_registry.list_all_agents", new=AsyncMock()) as mock_list:
+            await recursive_invocation._validate_agent_exists("Steve Jobs", {"Steve Jobs"})
+
+        mock_list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_registry_snapshot_is_cached(self):
+        """Test that repeated validations reuse the cached registry snapshot."""
+        cards = [_make_card("Steve Jobs")]
+
+        with patch("mantis.tools.agent_registry.list_all_agents", new=AsyncMock(return_value=cards)) as mock_list:
+            await recursive_invocation._validate_agent_exists("Steve Jobs")
+            await recursive_invocation._validate_agent_exists("Steve Jobs")
+
+        assert mock_list.await_count == 1
+
+
+class TestInvokeMultipleAgents:
+    """Test parallel multi-agent invocation."""
+
+    @pytest.mark.asyncio
+    async def test_results_preserve_requested_order(self):
+        """Test that results follow the requested agent order regardless of completion order."""
+        import asyncio
+
+        names = ["Steve Jobs", "Peter Drucker", "Marcus Aurelius"]
+        delays = {"Steve Jobs": 0.03, "Peter Drucker": 0.0, "Marcus Aurelius": 0.01}
+
+        async def fake_invoke(agent_name, **kwargs):
+            await asyncio.sleep(delays[agent_name])
+            return recursive_invocation.mantis_core_pb2.SimulationOutput(context_id=agent_name)
+
+        with patch.object(recursive_invocation, "_fetch_available_agent_names", new=AsyncMock(return_value=set(names))):
+            with patch.object(recursive_invocation, "invoke_agent_by_name", new=fake_invoke):
+                results = await recursive_invocation.invoke_multiple_agents(names, "query", orchestrator=MagicMock())
+
+        assert list(results) == names
+        assert results["Peter Drucker"].context_id == "Peter Drucker"
+
+    @pytest.mark.asyncio
+    async def test_first_failure_fails_fast(self):
+        """Test that one failing agent fails the whole coordination."""
+        names = ["Steve Jobs", "Peter Drucker"]
+
+        async def fake_invoke(agent_name, **kwargs):
+            if agent_name == "Peter Drucker":
+                raise RuntimeError("boom")
+            return recursive_invocation.mantis_core_pb2.SimulationOutput()
+
+        with patch.object(recursive_invocation, "_fetch_available_agent_names", new=AsyncMock(return_value=set(names))):
+            with patch.object(recursive_invocation, "invoke_agent_by_name", new=fake_invoke):
+                with pytest.raises(RuntimeError) as exc_info:
+                    await recursive_invocation.invoke_multiple_agents(names, "query", orchestrator=MagicMock())
+
+        assert "Peter Drucker returned error" in str(exc_info.value)
+        assert exc_info.value.__suppress_context__
+        assert str(exc_info.value.__cause__) == "boom"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_agent_names_are_invoked_once(self):
+        """Test that a repeated agent name runs once, keeping first-seen order and its first context."""
+        with patch.object(recursive_invocation, "_fetch_available_agent_names", new=AsyncMock()) as mock_fetch:
+            with patch.object(recursive_invocation, "invoke_agent_by_name", new=AsyncMock()) as mock_invoke:
+                mock_invoke.return_value = recursive_invocation.mantis_core_pb2.SimulationOutput()
+
+                results = await recursive_invocation.invoke_multiple_agents(
+                    ["Steve Jobs", "Peter Drucker", "Steve Jobs"],
+                    "query",
+                    orchestrator=MagicMock(),
+                    individual_contexts=["first", "second", "third"],
+                )
+
+        assert list(results) == ["Steve Jobs", "Peter Drucker"]
+        assert [(c.kwargs["agent_name"], c.kwargs["context"]) for c in mock_invoke.await_args_list] == [
+            ("Steve Jobs", "first"),
+            ("Peter Drucker", "second"),
+        ]
+        mock_fetch.assert_not_called()
+
+
+def test_make_simulation_output_populates_response_message():
+    """Test that the output helper builds the full response tree."""
+    output = recursive_invocation._make_simulation_output("ctx-1", "hello")
+
+    assert output.context_id == "ctx-1"
+    assert output.final_state == recursive_invocation.a2a_pb2.TASK_STATE_COMPLETED
+    assert output.response_message.role == recursive_invocation.a2a_pb2.ROLE_AGENT
+    assert output.response_message.content[0].text == "hello"
+
+
+class TestInvokeAgentByName:
+    """Test single-agent invocation dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_hardcoded_agent_skips_registry(self):
+        """Test that hardcoded A2A agents are called without a registry lookup."""
+        with patch.object(recursive_invocation, "_validate_agent_exists", new=AsyncMock()) as mock_validate:
+            with patch.object(recursive_invocation, "_call_agent_directly_a2a", new=AsyncMock()) as mock_call:
+                await recursive_invocation.invoke_agent_by_name("Steve Jobs", "query", orchestrator=MagicMock())
+
+        mock_validate.assert_not_called()
+        assert mock_call.await_args.kwargs["agent_url"] == recursive_invocation._AGENT_URL_MAP["Steve Jobs"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_agent_is_validated(self):
+        """Test that agents outside the hardcoded map are validated against the registry."""
+        with patch.object(
+            recursive_invocation, "_validate_agent_exists", new=AsyncMock(side_effect=ValueError("missing"))
+        ):
+            with pytest.raises(ValueError):
+                await recursive_invocation.invoke_agent_by_name("Nobody", "query", orchestrator=MagicMock())
+
+
+class TestDirectA2ACoalescing:
+    """Test in-flight deduplication of direct A2A calls."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_request(self):
+        """Test that duplicate concurrent calls issue a single outbound request."""
+        import asyncio
+
+        async def fake_send(agent_name, agent_url, query, context=None):
+            await asyncio.sleep(0.01)
+            return recursive_invocation._make_simulation_output("ctx", "answer")
+
+        with patch.object(recursive_invocation, "_send_a2a_request", new=AsyncMock(side_effect=fake_send)) as mock_send:
+            first, second = await asyncio.gather(
+                recursive_invocation._call_agent_directly_a2a("Steve Jobs", "http://agent", "query"),
+                recursive_invocation._call_agent_directly_a2a("Steve Jobs", "http://agent", "query"),
+            )
+
+        assert mock_send.await_count == 1
+        assert first is not second
+        assert second.response_message.content[0].text == "answer"
+        assert not recursive_invocation._INFLIGHT_A2A_CALLS
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_joined_callers(self):
+        """Test that joined callers see the shared failure."""
+        import asyncio
+
+        async def fake_send(agent_name, agent_url, query, context=None):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("agent down")
+
+        with patch.object(recursive_invocation, "_send_a2a_request", new=AsyncMock(side_effect=fake_send)):
+            results = await asyncio.gather(
+                recursive_invocation._call_agent_directly_a2a("Steve Jobs", "http://agent", "query"),
+                recursive_invocation._call_agent_directly_a2a("Steve Jobs", "http://agent", "query"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not recursive_invocation._INFLIGHT_A2A_CALLS
+
+    @pytest.mark.asyncio
+    async def test_cancelling_first_caller_keeps_request_for_others(self):
+        """Test that cancelling the caller that started a request doesn't cancel it for joined callers."""
+        import asyncio
+
+        release = asyncio.Event()
+        cancelled = []
+
+        async def fake_send(agent_name, agent_url, query, context=None):
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                cancelled.append(agent_name)
+                raise
+            return recursive_invocation._make_simulation_output("ctx", "answer")
+
+        with patch.object(recursive_invocation, "_send_a2a_request", new=AsyncMock(side_effect=fake_send)) as mock_send:
+            first = asyncio.create_task(
+                recursive_invocation._call_agent_directly_a2a("Steve Jobs", "http://agent", "query")
+            )
+            second = asyncio.create_task(
+                recursive_invocation._call_agent_directly_a2a("Steve Jobs", "http://agent", "query")
+            )
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            result = await second
+
+        assert first.cancelled()
+        assert result.response_message.content[0].text == "answer"
+        assert mock_send.await_count == 1
+        assert not cancelled
+        assert not recursive_invocation._INFLIGHT_A2A_CALLS
+
+    @pytest.mark.asyncio
+    async def test_request_is_cancelled_when_last_caller_leaves(self):
+        """Test that the shared request is cancelled once no caller is waiting on it."""
+        import asyncio
+
+        cancelled = []
+
+        async def fake_send(agent_name, agent_url, query, context=None):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(agent_name)
+                raise
+
+        with patch.object(recursive_invocation, "_send_a2a_request", new=AsyncMock(side_effect=fake_send)):
+            callers = [
+                asyncio.create_task(recursive_invocation._call_agent_directly_a2a("Steve Jobs", "http://agent", "q"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        assert cancelled == ["Steve Jobs"]
+        assert not recursive_invocation._INFLIGHT_A2A_CALLS
+
+
+class TestAggregateNestedOutput:
+    """Test artifact aggregation from nested simulation outputs."""
+
+    @pytest.mark.asyncio
+    async def test_artifacts_are_attributed_and_appended(self):
+        """Test that direct and nested artifacts are copied with attribution."""
+        a2a_pb2 = recursive_invocation.a2a_pb2
+        parent_task = a2a_pb2.Task()
+        orchestrator = MagicMock()
+        orchestrator.get_task_by_id.return_value = parent_task
+
+        nested_output = recursive_invocation.mantis_core_pb2.SimulationOutput()
+        nested_output.response_artifacts.add(name="draft", description="Draft")
+        nested_result = nested_output.results.add()
+        nested_result.response_artifacts.add(name="Peter Drucker_response", description="Original")
+        nested_result.response_artifacts.add(name="notes", description="Notes")
+
+        await recursive_invocation._aggregate_nested_output("task-1", nested_output, orchestrator, "Steve Jobs")
+
+        names = [(a.name, a.description) for a in parent_task.artifacts]
+        assert names == [
+            ("Steve Jobs_response", "Response from Steve Jobs"),
+            ("Peter Drucker_response", "Response from Peter Drucker"),
+            ("nested_notes", "Nested response: Notes"),
+        ]
+        assert nested_output.response_artifacts[0].name == "draft"
+
+    @pytest.mark.asyncio
+    async def test_empty_output_skips_parent_lookup(self):
+        """Test that outputs without artifacts don't touch the orchestrator."""
+        orchestrator = MagicMock()
+        nested_output = recursive_invocation.mantis_core_pb2.SimulationOutput()
+        nested_output.results.add()
+
+        await recursive_invocation._aggregate_nested_output("task-1", nested_output, orchestrator, "Steve Jobs")
+
+        orchestrator.get_task_by_id.assert_not_called()
+
+
+class TestSendA2ARequestPolling:
+    """Test poll error classification in direct A2A calls."""
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_poll_status_fails_immediately(self):
+        """Test that a 4xx from tasks/get fails the call instead of polling until timeout."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        poll_count = 0
+
+        async def handler(request):
+            nonlocal poll_count
+            body = await request.json()
+            if body["method"] == "message/send":
+                return web.json_response({"jsonrpc": "2.0", "result": {"id": "task-1"}, "id": body["id"]})
+            poll_count += 1
+            return web.Response(status=404)
+
+        app = web.Application()
+        app.router.add_post("/", handler)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            with patch.object(recursive_invocation, "_validate_agent_availability", new=AsyncMock()):
+                with patch.object(recursive_invocation.asyncio, "sleep", new=AsyncMock()):
+                    with pytest.raises(RuntimeError) as exc_info:
+                        await recursive_invocation._send_a2a_request("Steve Jobs", str(server.make_url("/")), "q")
+        finally:
+            await server.close()
+
+        assert poll_count == 1
+        assert "HTTP 404" in str(exc_info.value)
@@ -134,4 +134,75 @@ async def test_registry_get_agent_details_error():
         
         result = await registry_get_agent_details("https://example.com/nonexistent")
         
-        assert "Failed to fetch agent details: HTTP 404" in result
\ No newline at end of file
+        assert "Failed to fetch agent details: HTTP 404" in result
+
+@pytest.mark.asyncio
+async def test_get_agent_by_name_uses_cached_index():
+    """Test that repeated lookups reuse one registry snapshot, return copies and miss-refresh before failing."""
+    from mantis.tools import agent_registry
+    from mantis.proto.mantis.v1.mantis_persona_pb2 import MantisAgentCard
+
+    card = MantisAgentCard()
+    card.agent_card.name = "Steve Jobs"
+
+    with patch.object(agent_registry, "_AGENT_INDEX", None):
+        with patch.object(agent_registry, "list_all_agents", new=AsyncMock(return_value=[card])) as mock_list:
+            first = await agent_registry.get_agent_by_name("Steve Jobs")
+            first.agent_card.name = "Mutated"
+            second = await agent_registry.get_agent_by_name("Steve Jobs")
+            assert mock_list.await_count == 1
+            assert first is not second
+            assert second == card
+
+            with pytest.raises(ValueError) as exc_info:
+                await agent_registry.get_agent_by_name("Nobody")
+            assert mock_list.await_count == 2
+
+    assert "Available: Steve Jobs" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_registry_search_agents_caches_normalized_queries():
+    """Test that repeated queries differing only in case and spacing hit the cache."""
+    from unittest.mock import MagicMock
+    from mantis.tools import agent_registry
+
+    mock_response = MagicMock()
+    mock_response.status = 200
+    mock_response.read = AsyncMock(
+        return_value=b'{"agents": [{"name": "Ethicist", "description": "Ethics", "url": "https://example.com/a"}]}'
+    )
+    mock_session = MagicMock()
+    mock_session.post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_session.post.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    with patch.object(agent_registry, "_SEARCH_CACHE", agent_registry.TTLCache(ttl=60.0, max_entries=256)):
+        with patch.object(agent_registry._SESSION, "get", new=AsyncMock(return_value=mock_session)):
+            first = await registry_search_agents("Find an ethicist", limit=5)
+            second = await registry_search_agents("  find an   ETHICIST ", limit=5)
+
+    assert mock_session.post.call_count == 1
+    assert "Ethicist" in first and "Ethicist" in second
+
+
+@pytest.mark.asyncio
+async def test_registry_search_agents_does_not_cache_empty_results():
+    """Test that a search with no matches is sent to the registry again next time."""
+    from unittest.mock import MagicMock
+    from mantis.tools import agent_registry
+
+    mock_response = MagicMock()
+    mock_response.status = 200
+    mock_response.read = AsyncMock(return_value=b'{"agents": []}')
+    mock_session = MagicMock()
+    mock_session.post.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_session.post.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    with patch.object(agent_registry, "_SEARCH_CACHE", agent_registry.TTLCache(ttl=60.0, max_entries=256)) as cache:
+        with patch.object(agent_registry._SESSION, "get", new=AsyncMock(return_value=mock_session)):
+            result = await registry_search_agents("nobody", limit=5)
+            await registry_search_agents("nobody", limit=5)
+
+    assert result == "No agents found matching query: 'nobody'"
+    assert mock_session.post.call_count == 2
+    assert not cache
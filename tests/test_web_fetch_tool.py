@@ -0,0 +1,117 @@
+"""
+Unit tests for web_fetch_url against a local aiohttp server.
+"""
+
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mantis.tools import web_fetch
+from mantis.tools.web_fetch import web_fetch_url, web_fetch_urls
+
+
+@pytest_asyncio.fixture
+async def local_server():
+    """Serve a few canned routes on localhost."""
+    app = web.Application()
+
+    async def hello(request):
+        return web.Response(text="hello world")
+
+    async def missing(request):
+        return web.Response(status=404, text="nope")
+
+    async def large(request):
+        return web.Response(body=b"x" * (256 * 1024))
+
+    async def latin1(request):
+        return web.Response(body="café".encode("latin-1"), content_type="text/plain", charset="latin-1")
+
+    app.router.add_get("/hello", hello)
+    app.router.add_get("/missing", missing)
+    app.router.add_get("/large", large)
+    app.router.add_get("/latin1", latin1)
+
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+    await web_fetch._SESSION.close()
+
+
+class TestWebFetchTool:
+    """Test web_fetch_url behaviour without external network access."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_content(self, local_server):
+        """Test that a successful fetch returns the body text."""
+        result = await web_fetch_url(str(local_server.make_url("/hello")))
+
+        assert result == "hello world"
+
+    @pytest.mark.asyncio
+    async def test_fetch_reports_http_errors(self, local_server):
+        """Test that non-200 responses are reported."""
+        result = await web_fetch_url(str(local_server.make_url("/missing")))
+
+        assert "HTTP 404" in result
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_across_calls(self, local_server):
+        """Test that consecutive fetches share one pooled session."""
+        await web_fetch_url(str(local_server.make_url("/hello")))
+        first_session = await web_fetch._SESSION.get()
+        await web_fetch_url(str(local_server.make_url("/hello")))
+
+        assert await web_fetch._SESSION.get() is first_session
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_is_truncated(self, local_server):
+        """Test that bodies beyond the size limit are cut off at the limit."""
+        with patch.object(web_fetch, "_MAX_CONTENT_SIZE", 100 * 1024):
+            result = await web_fetch_url(str(local_server.make_url("/large")))
+
+        assert len(result) == 100 * 1024
+
+    @pytest.mark.asyncio
+    async def test_fetch_respects_max_bytes(self, local_server):
+        """Test that max_bytes stops reading well before the hard size limit."""
+        result = await web_fetch_url(str(local_server.make_url("/large")), max_bytes=8192)
+
+        assert result == "x" * 8192
+
+    @pytest.mark.asyncio
+    async def test_fetch_rejects_non_positive_max_bytes(self):
+        """Test that a non-positive max_bytes is reported as a tool error without fetching."""
+        result = await web_fetch_url("http://example.invalid", max_bytes=0)
+
+        assert result == "Error fetching URL http://example.invalid: max_bytes must be at least 1"
+
+    @pytest.mark.asyncio
+    async def test_declared_charset_is_honored(self, local_server):
+        """Test that the response charset is used to decode the body."""
+        result = await web_fetch_url(str(local_server.make_url("/latin1")))
+
+        assert result == "café"
+
+    @pytest.mark.asyncio
+    async def test_fetch_urls_preserves_order(self, local_server):
+        """Test that batch fetches return one result per URL in request order."""
+        results = await web_fetch_urls(
+            [str(local_server.make_url("/missing")), str(local_server.make_url("/hello"))], concurrency=2
+        )
+
+        assert "HTTP 404" in results[0]
+        assert results[1] == "hello world"
+
+    @pytest.mark.asyncio
+    async def test_fetch_urls_rejects_non_positive_concurrency(self):
+        """Test that a non-positive concurrency yields one tool error per URL without fetching."""
+        results = await web_fetch_urls(["http://a.invalid", "http://b.invalid"], concurrency=0)
+
+        assert results == [
+            "Error fetching URL http://a.invalid: concurrency must be at least 1",
+            "Error fetching URL http://b.invalid: concurrency must be at least 1",
+        ]
@@ -5,6 +5,7 @@ Tests against real URLs - fail fast if they don't work.
 
 import pytest
 import os
+import re
 
 from mantis.tools.web_fetch import web_fetch_url
 
@@ -18,8 +19,7 @@ class TestWebFetchToolLive:
         """Test fetching GitHub API - live data."""
         result = await web_fetch_url("https://api.github.com/zen")
         
-        assert "error" not in result.lower()
-        assert "failed" not in result.lower()
+        assert not re.search("error|failed", result, re.IGNORECASE)
         assert len(result) > 10  # Should have substantial content
 
     @pytest.mark.skipif(not os.getenv('ANTHROPIC_API_KEY'), reason="ANTHROPIC_API_KEY not set")
@@ -29,10 +29,10 @@ class TestWebFetchToolLive:
         result = await web_fetch_url("https://httpbin.org/json")
         
         # Handle case where httpbin.org is temporarily down (HTTP 503, etc.)
-        if "http 503" in result.lower() or "failed" in result.lower():
+        if re.search("http 503|failed", result, re.IGNORECASE):
             pytest.skip("httpbin.org temporarily unavailable")
         
-        assert "error" not in result.lower()
+        assert not re.search("error", result, re.IGNORECASE)
         assert ('"slideshow"' in result or '"title"' in result)
 
     @pytest.mark.skipif(not os.getenv('ANTHROPIC_API_KEY'), reason="ANTHROPIC_API_KEY not set")
@@ -42,4 +42,4 @@ class TestWebFetchToolLive:
         result = await web_fetch_url("https://this-domain-should-not-exist-12345.com")
         
         # Should return error message
-        assert ("error" in result.lower() or "failed" in result.lower())
\ No newline at end of file
+        assert re.search("error|failed", result, re.IGNORECASE)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Unit tests for web_search without live DuckDuckGo access.
+"""
+
+import asyncio
+import sys
+import time
+
+import pytest
+from unittest.mock import patch
+
+from mantis.tools.web_search import web_search
+
+# mantis.tools re-exports the web_search function under the module's name, so fetch the module itself
+web_search_module = sys.modules["mantis.tools.web_search"]
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Reset the search result cache between tests."""
+    web_search_module._SEARCH_CACHE.clear()
+    yield
+    web_search_module._SEARCH_CACHE.clear()
+
+
+class TestWebSearchTool:
+    """Test web_search formatting and event-loop behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_formatted(self):
+        """Test that search hits are numbered with title, URL and snippet."""
+        hits = [
+            {"title": "Python", "href": "https://python.org", "body": "Language"},
+            {"title": "PyPI", "href": "https://pypi.org", "body": "Packages"},
+        ]
+
+        with patch.object(web_search_module, "_ddgs_text", return_value=hits):
+            result = await web_search("python", max_results=2)
+
+        assert result.startswith("Found 2 results for 'python':")
+        assert "1. **Python**\n   https://python.org\n   Language" in result
+        assert "2. **PyPI**" in result
+
+    @pytest.mark.asyncio
+    async def test_no_results(self):
+        """Test the empty result message."""
+        with patch.object(web_search_module, "_ddgs_text", return_value=[]):
+            result = await web_search("nothing")
+
+        assert result == "No results found for query: 'nothing'"
+
+    @pytest.mark.asyncio
+    async def test_search_does_not_block_event_loop(self):
+        """Test that the blocking DDGS call runs off the event loop."""
+
+        def slow_search(query, max_results):
+            time.sleep(0.1)
+            return []
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        with patch.object(web_search_module, "_ddgs_text", side_effect=slow_search):
+            await asyncio.gather(web_search("slow"), ticker())
+
+        assert ticks == 5
+
+    @pytest.mark.asyncio
+    async def test_repeated_queries_are_cached(self):
+        """Test that case and spacing variants of a query reuse cached results."""
+        hits = [{"title": "Python", "href": "https://python.org", "body": "Language"}]
+
+        with patch.object(web_search_module, "_ddgs_text", return_value=hits) as mock_search:
+            first = await web_search("Python docs", max_results=3)
+            second = await web_search("  python   DOCS", max_results=3)
+
+        assert mock_search.call_count == 1
+        assert "**Python**" in first and "**Python**" in second
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(self):
+        """Test that a query with no results is searched again on the next call."""
+        with patch.object(web_search_module, "_ddgs_text", return_value=[]) as mock_search:
+            await web_search("nothing")
+            await web_search("nothing")
+
+        assert mock_search.call_count == 2
+        assert not web_search_module._SEARCH_CACHE
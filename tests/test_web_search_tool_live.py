@@ -5,6 +5,7 @@ Tests against real search engines - fail fast if they don't work.
 
 import pytest
 import os
+import re
 
 from mantis.tools.web_search import web_search
 
@@ -19,12 +20,11 @@ class TestWebSearchToolLive:
         result = await web_search("Python programming language")
         
         # Handle case where search service is temporarily unavailable or rate limited
-        if "no results found" in result.lower():
+        if re.search("no results found", result, re.IGNORECASE):
             pytest.skip("Search service temporarily unavailable or rate limited")
         
-        assert "error" not in result.lower()
-        assert "failed" not in result.lower()
-        assert "python" in result.lower()
+        assert not re.search("error|failed", result, re.IGNORECASE)
+        assert re.search("python", result, re.IGNORECASE)
         assert len(result) > 100  # Should have substantial content
 
     @pytest.mark.skipif(not os.getenv('ANTHROPIC_API_KEY'), reason="ANTHROPIC_API_KEY not set")
@@ -34,12 +34,11 @@ class TestWebSearchToolLive:
         result = await web_search("GitHub repository hosting")
         
         # Handle case where search service is temporarily unavailable or rate limited
-        if "no results found" in result.lower():
+        if re.search("no results found", result, re.IGNORECASE):
             pytest.skip("Search service temporarily unavailable or rate limited")
         
-        assert "error" not in result.lower()
-        assert "failed" not in result.lower()
-        assert "github" in result.lower()
+        assert not re.search("error|failed", result, re.IGNORECASE)
+        assert re.search("github", result, re.IGNORECASE)
         assert len(result) > 100  # Should have substantial content
 
     @pytest.mark.skipif(not os.getenv('ANTHROPIC_API_KEY'), reason="ANTHROPIC_API_KEY not set")
@@ -49,4 +48,4 @@ class TestWebSearchToolLive:
         result = await web_search("")
         
         # Should return error message
-        assert ("error" in result.lower() or "failed" in result.lower() or "empty" in result.lower())
\ No newline at end of file
+        assert re.search("error|failed|empty", result, re.IGNORECASE)
\ No newline at end of file